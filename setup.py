@@ -21,6 +21,7 @@ setup(
     long_description_content_type='text/markdown',
     url='https://github.com/tu-usuario/slack-bot',
     packages=find_packages(exclude=['tests*', 'templates*']),
+    package_data={'slack_bot.templates.deploy': ['setup.sh']},
     install_requires=requirements,
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -5,15 +5,7 @@ Un bot de Slack inteligente impulsado por IA, diseñado para proporcionar
 asistencia contextual y conversacional.
 """
 
-# Importar submódulos principales
-from . import config
-from . import connectors
-from . import context
-from . import personality
-from . import schemas
-from . import utils
-from . import cli
-from . import templates
+import importlib
 
 # Información del paquete
 __version__ = "0.1.0"
@@ -21,18 +13,6 @@ __author__ = "{{ project_name_title }} Team"
 __email__ = "contacto@{{ project_name }}.com"
 __license__ = "MIT"
 
-# Componentes principales disponibles
-COMPONENTS = {
-    "config": config,
-    "connectors": connectors,
-    "context": context,
-    "personality": personality,
-    "schemas": schemas,
-    "utils": utils,
-    "cli": cli,
-    "templates": templates
-}
-
 # Exportar submódulos principales
 __all__ = [
     'config',
@@ -45,15 +25,41 @@ __all__ = [
     'templates'
 ]
 
+# Los submódulos se importan al primer acceso (PEP 562) para no cargar
+# connectors, personality, etc. en herramientas que no los usan
+_LAZY_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name):
+    """
+    Importa bajo demanda los submódulos principales y COMPONENTS.
+    
+    Args:
+        name (str): Nombre del atributo solicitado.
+        
+    Returns:
+        Any: Submódulo importado, o el diccionario de componentes principales.
+    """
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    
+    if name == "COMPONENTS":
+        # Componentes principales disponibles
+        return {component: __getattr__(component) for component in __all__}
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Información de inicialización
 def initialize():
     """
-    Inicializa el paquete del bot de Slack.
+    Inicializa el paquete del bot de Slack: configura el logging.
     
-    Realiza configuraciones y validaciones iniciales.
+    No se ejecuta al importar el paquete; la llama el punto de entrada del bot
+    (slack_bot.app.main), que también valida la configuración.
     """
-    # Validar configuraciones críticas
-    config.settings.validate_config()
+    from . import utils
     
     # Configurar logging
     utils.setup_logging()
@@ -62,6 +68,3 @@ def initialize():
     logger = utils.get_logger(__name__)
     logger.info(f"Inicializando Slack Bot v{__version__}")
     logger.info(f"Autor: {__author__}")
-
-# Inicializar al importar
-initialize()
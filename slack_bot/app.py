@@ -1,31 +1,97 @@
+import asyncio
+import logging
 import os
-from dotenv import load_dotenv
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
+import sys
 
-# Load environment variables
-load_dotenv()
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
+
+from slack_bot import initialize
+from slack_bot.config import settings
+from slack_bot.config.env import load_env
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables (once per process)
+ENV = load_env()
 
 # Initialize Slack app with bot token
-app = App(token=os.getenv('SLACK_BOT_TOKEN'))
+app = AsyncApp(token=ENV.get('SLACK_BOT_TOKEN'))
+
+# Handlers only enqueue; worker tasks do the replies so Slack gets its ack right away.
+# Created inside the running loop by start_workers()
+EVENT_QUEUE = None
+
+# Reply templates, built once; handlers only substitute the user id
+_MENTION_TMPL = "Hello <@%s>! I'm Lucius, your AI assistant."
+_HELLO_TMPL = "Hi there <@%s>! How can I help you today?"
+
+async def _reply_mention(event, say):
+    """Reply to an app mention"""
+    user = event.get('user', 'someone')
+    await say(_MENTION_TMPL % user)
+
+async def _reply_hello(message, say):
+    """Reply to a hello message"""
+    user = message.get('user', 'someone')
+    await say(_HELLO_TMPL % user)
 
 @app.event("app_mention")
-def handle_mention(event, say):
+async def handle_mention(event, say):
     """Basic handler for app mentions"""
-    user = event.get('user', 'someone')
-    say(f"Hello <@{user}>! I'm Lucius, your AI assistant.")
+    await EVENT_QUEUE.put((_reply_mention, event, say))
 
 @app.message("hello")
-def say_hello(message, say):
+async def say_hello(message, say):
     """Respond to hello messages"""
-    user = message.get('user', 'someone')
-    say(f"Hi there <@{user}>! How can I help you today?")
+    await EVENT_QUEUE.put((_reply_hello, message, say))
+
+async def _worker():
+    """Drain the event queue and run the reply for each event"""
+    while True:
+        reply, payload, say = await EVENT_QUEUE.get()
+        try:
+            await reply(payload, say)
+        except Exception:
+            logger.exception("Error processing queued event")
+        finally:
+            EVENT_QUEUE.task_done()
+
+def start_workers(num_workers=None):
+    """Create EVENT_QUEUE and start the worker tasks that drain it (needs a running loop)"""
+    global EVENT_QUEUE
+    EVENT_QUEUE = asyncio.Queue(maxsize=1024)
+    return [asyncio.create_task(_worker()) for _ in range(num_workers or os.cpu_count() or 1)]
+
+async def run():
+    """Start the workers and serve events over Socket Mode until disconnected"""
+    workers = start_workers()
+    try:
+        # Use Socket Mode with app token; reconnects and heartbeats run on the event loop
+        handler = AsyncSocketModeHandler(app, ENV.get('SLACK_APP_TOKEN'))
+        await handler.start_async()
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+def install_event_loop_policy():
+    """Use uvloop for the event loop when available; EVENT_LOOP=asyncio keeps the default loop"""
+    if ENV.get('EVENT_LOOP', 'uvloop') != 'uvloop' or sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 def main():
     """Main function to start the Slack bot"""
-    # Use Socket Mode with app token
-    handler = SocketModeHandler(app, os.getenv('SLACK_APP_TOKEN'))
-    handler.start()
+    # Fail fast on missing tokens before connecting
+    settings.validate_config()
+    initialize()
+    install_event_loop_policy()
+    asyncio.run(run())
 
 if __name__ == "__main__":
     main()
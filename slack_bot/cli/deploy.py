@@ -2,20 +2,36 @@
 Herramienta CLI para desplegar bots de Slack en Google Compute Engine.
 """
 import argparse
+import asyncio
+import importlib.resources
 import os
 import sys
-import subprocess
+import tarfile
 import tempfile
 import shutil
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 # Añadir directorio raíz al path para importar módulos
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from slack_bot.utils.logging import setup_logging
 
 logger = setup_logging()
 
+# Directorios y archivos que no deben desplegarse
+DEPLOY_IGNORE = frozenset({'.git', '.venv', 'venv', '__pycache__', '.env', '.vscode'})
+
+# Nombre del paquete de despliegue en el directorio home de la instancia
+REMOTE_ARCHIVE = 'slack_bot_deploy.tar.gz'
+
+# Entorno de los subprocesos: gcloud nunca debe quedarse esperando una respuesta interactiva
+COMMAND_ENV = {**os.environ, 'CLOUDSDK_CORE_DISABLE_PROMPTS': '1'}
+
 
 def parse_args():
     """
@@ -27,18 +43,20 @@ def parse_args():
     parser = argparse.ArgumentParser(description='Herramienta de despliegue de bots de Slack en GCE')
     
     parser.add_argument('--project-dir', '-p', default='.', help='Directorio del proyecto')
-    parser.add_argument('--instance-name', '-i', required=True, help='Nombre de la instancia de GCE')
+    parser.add_argument('--instance-name', '-i', required=True, action='append',
+                        help='Nombre de la instancia de GCE (se puede repetir para desplegar en varias)')
     parser.add_argument('--zone', '-z', default='us-central1-a', help='Zona de GCE')
     parser.add_argument('--create-instance', '-c', action='store_true', help='Crear instancia si no existe')
     parser.add_argument('--machine-type', '-m', default='e2-micro', help='Tipo de máquina para la instancia')
+    parser.add_argument('--concurrency', type=int, default=4, help='Máximo de instancias desplegadas en paralelo')
     parser.add_argument('--verbose', '-v', action='store_true', help='Modo verboso')
     
     return parser.parse_args()
 
 
-def run_command(command: List[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
+async def run_command(command: List[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
     """
-    Ejecuta un comando y devuelve su salida.
+    Ejecuta un comando de forma asíncrona y devuelve su salida.
     
     Args:
         command (List[str]): Comando a ejecutar.
@@ -48,47 +66,78 @@ def run_command(command: List[str], cwd: Optional[str] = None) -> Tuple[int, str
         Tuple[int, str, str]: Código de salida, stdout y stderr.
     """
     try:
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=cwd,
-            text=True
+            env=COMMAND_ENV
         )
-        stdout, stderr = process.communicate()
-        return process.returncode, stdout, stderr
+        stdout, stderr = await process.communicate()
+        return process.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
     except Exception as e:
         logger.error(f"Error al ejecutar comando {' '.join(command)}: {e}")
         return 1, "", str(e)
 
 
-def check_instance_exists(instance_name: str, zone: str) -> bool:
+async def check_instances_exist(instance_names: List[str], zone: str) -> Optional[Dict[str, bool]]:
     """
-    Verifica si una instancia de GCE existe.
+    Verifica con una sola llamada a gcloud qué instancias de GCE existen.
     
     Args:
-        instance_name (str): Nombre de la instancia.
+        instance_names (List[str]): Nombres de las instancias.
         zone (str): Zona de GCE.
         
     Returns:
-        bool: True si la instancia existe, False en caso contrario.
+        Optional[Dict[str, bool]]: Para cada nombre, True si la instancia existe; None si
+            no se pudo determinar (gcloud falló o devolvió una respuesta inesperada).
     """
     command = [
-        "gcloud", "compute", "instances", "describe",
-        instance_name, "--zone", zone, "--format=value(name)"
+        "gcloud", "compute", "instances", "list",
+        "--zones", zone,
+        f"--filter=name:({' OR '.join(instance_names)})",
+        "--format=json(name)"
     ]
     
-    returncode, stdout, stderr = run_command(command)
+    returncode, stdout, stderr = await run_command(command)
     
-    if returncode == 0 and stdout.strip():
-        logger.info(f"Instancia {instance_name} encontrada en zona {zone}")
-        return True
+    if returncode != 0:
+        logger.error(f"Error al listar instancias: {stderr}")
+        return None
     
-    logger.info(f"Instancia {instance_name} no encontrada en zona {zone}")
-    return False
+    try:
+        found = {instance["name"] for instance in json_loads(stdout or "[]")}
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Respuesta inesperada de gcloud: {e}")
+        return None
+    
+    result = {}
+    for instance_name in instance_names:
+        result[instance_name] = instance_name in found
+        if result[instance_name]:
+            logger.info(f"Instancia {instance_name} encontrada en zona {zone}")
+        else:
+            logger.info(f"Instancia {instance_name} no encontrada en zona {zone}")
+    
+    return result
 
 
-def create_instance(instance_name: str, zone: str, machine_type: str) -> bool:
+async def check_instance_exists(instance_name: str, zone: str) -> Optional[bool]:
+    """
+    Verifica si una instancia de GCE existe.
+    
+    Args:
+        instance_name (str): Nombre de la instancia.
+        zone (str): Zona de GCE.
+        
+    Returns:
+        Optional[bool]: True si la instancia existe, False si no, None si no se pudo verificar.
+    """
+    result = await check_instances_exist([instance_name], zone)
+    return result[instance_name] if result is not None else None
+
+
+async def create_instance(instance_name: str, zone: str, machine_type: str) -> bool:
     """
     Crea una instancia de GCE.
     
@@ -112,7 +161,7 @@ def create_instance(instance_name: str, zone: str, machine_type: str) -> bool:
         "--boot-disk-type", "pd-standard"
     ]
     
-    returncode, stdout, stderr = run_command(command)
+    returncode, stdout, stderr = await run_command(command)
     
     if returncode == 0:
         logger.info(f"Instancia {instance_name} creada exitosamente")
@@ -122,84 +171,22 @@ def create_instance(instance_name: str, zone: str, machine_type: str) -> bool:
     return False
 
 
-def create_setup_script() -> str:
+def _link_or_copy(source: str, destination: str) -> str:
     """
-    Crea un script de configuración para la instancia.
+    Crea un enlace duro al archivo o lo copia si no es posible (p. ej. entre sistemas de archivos).
     
+    Args:
+        source (str): Ruta del archivo de origen.
+        destination (str): Ruta de destino.
+        
     Returns:
-        str: Ruta del script creado.
+        str: Ruta de destino.
     """
-    script_content = """#!/bin/bash
-
-# Actualizar sistema
-echo "Actualizando sistema..."
-sudo apt-get update
-sudo apt-get upgrade -y
-
-# Instalar dependencias
-echo "Instalando dependencias..."
-sudo apt-get install -y python3 python3-pip python3-venv git supervisor
-
-# Crear directorio para el bot
-echo "Configurando directorio del bot..."
-mkdir -p ~/slack_bot
-
-# Mover archivos al directorio del bot
-echo "Moviendo archivos..."
-mv ./* ~/slack_bot/ 2>/dev/null || true
-
-# Crear entorno virtual
-echo "Creando entorno virtual..."
-cd ~/slack_bot
-python3 -m venv venv
-source venv/bin/activate
-
-# Instalar dependencias
-echo "Instalando dependencias de Python..."
-pip install --upgrade pip
-pip install -r requirements.txt
-
-# Crear archivo de configuración para supervisor
-echo "Configurando supervisor..."
-cat > slack_bot.conf << EOT
-[program:slack_bot]
-command=/home/$(whoami)/slack_bot/venv/bin/python /home/$(whoami)/slack_bot/app.py
-directory=/home/$(whoami)/slack_bot
-autostart=true
-autorestart=true
-startretries=10
-user=$(whoami)
-redirect_stderr=true
-stdout_logfile=/home/$(whoami)/slack_bot/slack_bot.log
-stdout_logfile_maxbytes=50MB
-stdout_logfile_backups=10
-environment=PYTHONUNBUFFERED=1
-EOT
-
-# Instalar el servicio
-echo "Instalando servicio..."
-sudo mv slack_bot.conf /etc/supervisor/conf.d/
-sudo supervisorctl reread
-sudo supervisorctl update
-sudo supervisorctl start slack_bot
-
-# Verificar estado del servicio
-echo "Verificando estado del servicio..."
-sudo supervisorctl status slack_bot
-
-echo "¡Configuración completada!"
-echo "El bot está ahora ejecutándose como un servicio."
-echo "Puedes ver los logs en: ~/slack_bot/slack_bot.log"
-"""
-    
-    # Crear archivo temporal
-    fd, path = tempfile.mkstemp(suffix='.sh')
-    os.write(fd, script_content.encode('utf-8'))
-    os.close(fd)
-    os.chmod(path, 0o755)  # Hacer ejecutable
-    
-    logger.debug(f"Script de configuración creado en: {path}")
-    return path
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+    return destination
 
 
 def prepare_deployment_files(project_dir: str) -> str:
@@ -217,26 +204,26 @@ def prepare_deployment_files(project_dir: str) -> str:
     logger.debug(f"Directorio temporal creado: {temp_dir}")
     
     try:
-        # Copiar archivos del proyecto
-        for item in os.listdir(project_dir):
-            # Ignorar directorios y archivos que no deben desplegarse
-            if item in ['.git', '.venv', 'venv', '__pycache__', '.env', '.vscode']:
-                continue
-            
-            source = os.path.join(project_dir, item)
-            destination = os.path.join(temp_dir, item)
-            
-            if os.path.isdir(source):
-                shutil.copytree(source, destination)
-                logger.debug(f"Directorio copiado: {item}")
-            else:
-                shutil.copy2(source, destination)
-                logger.debug(f"Archivo copiado: {item}")
+        # Enlazar archivos del proyecto (el directorio temporal es de solo lectura)
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                # Ignorar directorios y archivos que no deben desplegarse
+                if entry.name in DEPLOY_IGNORE:
+                    continue
+                
+                destination = os.path.join(temp_dir, entry.name)
+                
+                if entry.is_dir():
+                    shutil.copytree(entry.path, destination, copy_function=_link_or_copy)
+                    logger.debug(f"Directorio enlazado: {entry.name}")
+                else:
+                    _link_or_copy(entry.path, destination)
+                    logger.debug(f"Archivo enlazado: {entry.name}")
         
-        # Crear script de configuración
-        setup_script = create_setup_script()
-        shutil.copy2(setup_script, os.path.join(temp_dir, 'setup.sh'))
-        os.unlink(setup_script)  # Eliminar archivo temporal
+        # Añadir script de configuración (recurso del paquete)
+        setup_script = importlib.resources.files('slack_bot.templates.deploy').joinpath('setup.sh')
+        with importlib.resources.as_file(setup_script) as setup_script_path:
+            _link_or_copy(str(setup_script_path), os.path.join(temp_dir, 'setup.sh'))
         
         logger.info(f"Archivos preparados en: {temp_dir}")
         return temp_dir
@@ -246,12 +233,60 @@ def prepare_deployment_files(project_dir: str) -> str:
         raise
 
 
-def deploy_to_instance(temp_dir: str, instance_name: str, zone: str) -> bool:
+def create_deployment_archive(temp_dir: str) -> str:
     """
-    Despliega los archivos a la instancia.
+    Empaqueta los archivos preparados en un único tar.gz.
     
     Args:
         temp_dir (str): Directorio temporal con los archivos.
+        
+    Returns:
+        str: Ruta del archivo creado.
+    """
+    fd, archive_path = tempfile.mkstemp(suffix='.tar.gz')
+    os.close(fd)
+    
+    with tarfile.open(archive_path, 'w:gz') as archive:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                archive.add(entry.path, arcname=entry.name)
+    
+    logger.debug(f"Paquete de despliegue creado en: {archive_path}")
+    return archive_path
+
+
+def build_deployment_archive(project_dir: str) -> Optional[str]:
+    """
+    Prepara los archivos del proyecto y los empaqueta para el despliegue.
+    
+    Args:
+        project_dir (str): Directorio del proyecto.
+        
+    Returns:
+        Optional[str]: Ruta del paquete creado, o None si hubo un error.
+    """
+    try:
+        temp_dir = prepare_deployment_files(project_dir)
+    except Exception:
+        return None
+    
+    try:
+        return create_deployment_archive(temp_dir)
+    except Exception as e:
+        logger.error(f"Error al empaquetar archivos: {e}")
+        return None
+    finally:
+        # Limpiar directorio temporal
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        logger.debug(f"Directorio temporal eliminado: {temp_dir}")
+
+
+async def deploy_to_instance(archive_path: str, instance_name: str, zone: str) -> bool:
+    """
+    Despliega los archivos a la instancia.
+    
+    Args:
+        archive_path (str): Paquete tar.gz con los archivos.
         instance_name (str): Nombre de la instancia.
         zone (str): Zona de GCE.
         
@@ -259,15 +294,15 @@ def deploy_to_instance(temp_dir: str, instance_name: str, zone: str) -> bool:
         bool: True si se desplegó correctamente, False en caso contrario.
     """
     try:
-        # Copiar archivos a la instancia
+        # Copiar el paquete a la instancia (un solo archivo, sin depender de globs)
         logger.info(f"Copiando archivos a la instancia {instance_name}...")
         command = [
-            "gcloud", "compute", "scp", "--recurse",
-            f"{temp_dir}/*", f"{instance_name}:~/",
+            "gcloud", "compute", "scp",
+            archive_path, f"{instance_name}:~/{REMOTE_ARCHIVE}",
             "--zone", zone
         ]
         
-        returncode, stdout, stderr = run_command(command)
+        returncode, stdout, stderr = await run_command(command)
         
         if returncode != 0:
             logger.error(f"Error al copiar archivos: {stderr}")
@@ -275,15 +310,15 @@ def deploy_to_instance(temp_dir: str, instance_name: str, zone: str) -> bool:
         
         logger.info("Archivos copiados exitosamente")
         
-        # Ejecutar script de configuración
+        # Extraer el paquete y ejecutar script de configuración
         logger.info("Ejecutando script de configuración...")
         command = [
             "gcloud", "compute", "ssh",
             instance_name, "--zone", zone,
-            "--command", "bash ~/setup.sh"
+            "--command", f"tar -xzf ~/{REMOTE_ARCHIVE} -C ~ && rm ~/{REMOTE_ARCHIVE} && bash ~/setup.sh"
         ]
         
-        returncode, stdout, stderr = run_command(command)
+        returncode, stdout, stderr = await run_command(command)
         
         if returncode != 0:
             logger.error(f"Error al ejecutar script de configuración: {stderr}")
@@ -294,54 +329,135 @@ def deploy_to_instance(temp_dir: str, instance_name: str, zone: str) -> bool:
         
         return True
     except Exception as e:
-        logger.error(f"Error al desplegar a la instancia: {e}")
+        logger.error(f"Error al desplegar a la instancia {instance_name}: {e}")
         return False
-    finally:
-        # Limpiar directorio temporal
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        logger.debug(f"Directorio temporal eliminado: {temp_dir}")
 
 
-def deploy(
-    project_dir: str,
+async def deploy_one(
+    archive_path: str,
     instance_name: str,
     zone: str,
     create_instance_if_not_exists: bool = False,
-    machine_type: str = 'e2-micro'
+    machine_type: str = 'e2-micro',
+    instance_exists: Optional[bool] = None
 ) -> bool:
     """
-    Despliega un bot de Slack en Google Compute Engine.
+    Despliega los archivos preparados en una única instancia, creándola si es necesario.
     
     Args:
-        project_dir (str): Directorio del proyecto.
+        archive_path (str): Paquete tar.gz con los archivos.
         instance_name (str): Nombre de la instancia de GCE.
         zone (str): Zona de GCE.
         create_instance_if_not_exists (bool): Si se debe crear la instancia si no existe.
         machine_type (str): Tipo de máquina para la instancia.
+        instance_exists (Optional[bool]): Resultado ya conocido de la verificación. Si es None, se consulta a gcloud.
         
     Returns:
         bool: True si se desplegó correctamente, False en caso contrario.
     """
     # Verificar si la instancia existe
-    instance_exists = check_instance_exists(instance_name, zone)
+    if instance_exists is None:
+        instance_exists = await check_instance_exists(instance_name, zone)
+        if instance_exists is None:
+            # No asumir que falta: crearla podría chocar con una instancia existente
+            logger.error(f"No se pudo verificar si la instancia {instance_name} existe; se cancela el despliegue")
+            return False
     
     # Crear instancia si es necesario
     if not instance_exists:
         if create_instance_if_not_exists:
-            if not create_instance(instance_name, zone, machine_type):
+            if not await create_instance(instance_name, zone, machine_type):
                 return False
         else:
             logger.error(f"La instancia {instance_name} no existe y no se ha especificado --create-instance")
             return False
     
-    # Preparar archivos para el despliegue
-    try:
-        temp_dir = prepare_deployment_files(project_dir)
-    except Exception:
+    return await deploy_to_instance(archive_path, instance_name, zone)
+
+
+async def deploy_async(
+    project_dir: str,
+    instance_names: List[str],
+    zone: str,
+    create_instance_if_not_exists: bool = False,
+    machine_type: str = 'e2-micro',
+    concurrency: int = 4
+) -> bool:
+    """
+    Despliega un bot de Slack en varias instancias de forma concurrente.
+    
+    Args:
+        project_dir (str): Directorio del proyecto.
+        instance_names (List[str]): Nombres de las instancias de GCE.
+        zone (str): Zona de GCE.
+        create_instance_if_not_exists (bool): Si se debe crear la instancia si no existe.
+        machine_type (str): Tipo de máquina para la instancia.
+        concurrency (int): Máximo de instancias desplegadas en paralelo.
+        
+    Returns:
+        bool: True si se desplegó correctamente en todas las instancias, False en caso contrario.
+    """
+    # Empaquetar los archivos (una sola vez, en un hilo) mientras se consulta a
+    # gcloud por todas las instancias en una sola llamada
+    archive_path, existing = await asyncio.gather(
+        asyncio.to_thread(build_deployment_archive, project_dir),
+        check_instances_exist(instance_names, zone)
+    )
+    if existing is None:
+        logger.error("No se pudo verificar qué instancias existen; se cancela el despliegue")
+        if archive_path is not None:
+            os.unlink(archive_path)
         return False
+    if archive_path is None:
+        return False
+    
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def limited(instance_name: str) -> bool:
+        async with semaphore:
+            return await deploy_one(
+                archive_path, instance_name, zone, create_instance_if_not_exists, machine_type,
+                instance_exists=existing[instance_name]
+            )
+    
+    try:
+        results = await asyncio.gather(*[limited(name) for name in instance_names])
+        return all(results)
+    finally:
+        os.unlink(archive_path)
+
+
+def deploy(
+    project_dir: str,
+    instance_name: Union[str, List[str]],
+    zone: str,
+    create_instance_if_not_exists: bool = False,
+    machine_type: str = 'e2-micro',
+    concurrency: int = 4
+) -> bool:
+    """
+    Despliega un bot de Slack en Google Compute Engine.
     
-    # Desplegar a la instancia
-    return deploy_to_instance(temp_dir, instance_name, zone)
+    Args:
+        project_dir (str): Directorio del proyecto.
+        instance_name (Union[str, List[str]]): Nombre de la instancia de GCE o lista de nombres.
+        zone (str): Zona de GCE.
+        create_instance_if_not_exists (bool): Si se debe crear la instancia si no existe.
+        machine_type (str): Tipo de máquina para la instancia.
+        concurrency (int): Máximo de instancias desplegadas en paralelo.
+        
+    Returns:
+        bool: True si se desplegó correctamente, False en caso contrario.
+    """
+    instance_names = [instance_name] if isinstance(instance_name, str) else list(instance_name)
+    return asyncio.run(deploy_async(
+        project_dir,
+        instance_names,
+        zone,
+        create_instance_if_not_exists=create_instance_if_not_exists,
+        machine_type=machine_type,
+        concurrency=concurrency
+    ))
 
 
 def main():
@@ -360,16 +476,18 @@ def main():
         instance_name=args.instance_name,
         zone=args.zone,
         create_instance_if_not_exists=args.create_instance,
-        machine_type=args.machine_type
+        machine_type=args.machine_type,
+        concurrency=args.concurrency
     )
     
     # Mostrar mensaje final
     if success:
-        print(f"\n✅ Bot desplegado exitosamente en la instancia {args.instance_name}.")
-        print("\nComandos útiles:")
-        print(f"- Ver logs: gcloud compute ssh {args.instance_name} --zone={args.zone} --command=\"tail -f ~/slack_bot/slack_bot.log\"")
-        print(f"- Estado del servicio: gcloud compute ssh {args.instance_name} --zone={args.zone} --command=\"sudo supervisorctl status slack_bot\"")
-        print(f"- Reiniciar servicio: gcloud compute ssh {args.instance_name} --zone={args.zone} --command=\"sudo supervisorctl restart slack_bot\"")
+        print(f"\n✅ Bot desplegado exitosamente en: {', '.join(args.instance_name)}.")
+        for instance_name in args.instance_name:
+            print(f"\nComandos útiles ({instance_name}):")
+            print(f"- Ver logs: gcloud compute ssh {instance_name} --zone={args.zone} --command=\"tail -f ~/slack_bot/slack_bot.log\"")
+            print(f"- Estado del servicio: gcloud compute ssh {instance_name} --zone={args.zone} --command=\"sudo supervisorctl status slack_bot\"")
+            print(f"- Reiniciar servicio: gcloud compute ssh {instance_name} --zone={args.zone} --command=\"sudo supervisorctl restart slack_bot\"")
     else:
         print("\n❌ Error al desplegar el bot. Revise los mensajes de error.")
         sys.exit(1)
@@ -2,10 +2,12 @@
 Herramienta CLI para generar proyectos de bot de Slack.
 """
 import argparse
+import mmap
 import os
+import re
 import shutil
 import sys
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 # Añadir directorio raíz al path para importar módulos
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -14,6 +16,12 @@ from slack_bot.utils.logging import setup_logging
 
 logger = setup_logging()
 
+# Coincide con cualquier marcador de la forma {{ nombre }}
+PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Tamaño a partir del cual los archivos se inspeccionan con mmap
+MMAP_THRESHOLD = 64 * 1024
+
 
 def parse_args():
     """
@@ -94,6 +102,57 @@ def copy_template_files(template_name: str, project_path: str) -> bool:
         return False
 
 
+def iter_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recorre recursivamente los archivos de un directorio usando os.scandir.
+    
+    Args:
+        root (str): Directorio raíz.
+        
+    Yields:
+        os.DirEntry: Entrada de cada archivo encontrado.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def read_template_file(entry: os.DirEntry) -> Optional[str]:
+    """
+    Lee un archivo de plantilla solo si contiene algún marcador.
+    
+    La búsqueda de "{{" se hace sobre los bytes (con mmap en archivos grandes),
+    de modo que los archivos sin marcadores nunca se decodifican.
+    
+    Args:
+        entry (os.DirEntry): Entrada del archivo.
+        
+    Returns:
+        Optional[str]: Contenido del archivo, o None si no tiene marcadores o es binario.
+    """
+    with open(entry.path, 'rb') as f:
+        size = entry.stat().st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"{{") == -1:
+                    return None
+                data = mm[:]
+        else:
+            data = f.read()
+            if b"{{" not in data:
+                return None
+    
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        # Ignorar archivos binarios que no se detectaron por extensión
+        logger.debug(f"Ignorando archivo binario: {entry.path}")
+        return None
+
+
 def replace_template_variables(project_path: str, variables: Dict[str, str]) -> bool:
     """
     Reemplaza las variables de la plantilla en los archivos.
@@ -107,36 +166,24 @@ def replace_template_variables(project_path: str, variables: Dict[str, str]) ->
     """
     try:
         # Recorrer todos los archivos del proyecto
-        for root, _, files in os.walk(project_path):
-            for file in files:
-                # Ignorar archivos binarios
-                if file.endswith(('.pyc', '.pyo', '.so', '.dll', '.exe')):
-                    continue
-                
-                file_path = os.path.join(root, file)
-                
-                # Leer contenido del archivo
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    # Ignorar archivos binarios que no se detectaron por extensión
-                    logger.debug(f"Ignorando archivo binario: {file_path}")
-                    continue
-                
-                # Reemplazar variables
-                modified = False
-                for var_name, var_value in variables.items():
-                    placeholder = f"{{{{ {var_name} }}}}"
-                    if placeholder in content:
-                        content = content.replace(placeholder, var_value)
-                        modified = True
-                
-                # Guardar archivo modificado
-                if modified:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    logger.debug(f"Variables reemplazadas en: {file_path}")
+        for entry in iter_files(project_path):
+            # Ignorar archivos binarios
+            if entry.name.endswith(('.pyc', '.pyo', '.so', '.dll', '.exe')):
+                continue
+            
+            # Leer contenido del archivo (None si no hay marcadores)
+            content = read_template_file(entry)
+            if content is None:
+                continue
+            
+            # Reemplazar variables en una sola pasada; los marcadores desconocidos se conservan
+            new_content = PLACEHOLDER_RE.sub(lambda m: variables.get(m.group(1), m.group(0)), content)
+            
+            # Guardar archivo modificado
+            if new_content != content:
+                with open(entry.path, 'w', encoding='utf-8') as f:
+                    f.write(new_content)
+                logger.debug(f"Variables reemplazadas en: {entry.path}")
         
         logger.info("Variables de plantilla reemplazadas")
         return True
@@ -0,0 +1,23 @@
+"""
+Carga única de variables de entorno para {{ project_name_title }}.
+"""
+import functools
+import os
+import types
+from typing import Mapping
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> Mapping[str, str]:
+    """
+    Carga el archivo .env una sola vez por proceso.
+
+    Las llamadas posteriores devuelven la misma vista sin volver a leer el archivo.
+
+    Returns:
+        Mapping[str, str]: Vista de solo lectura de las variables de entorno.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return types.MappingProxyType(dict(os.environ))
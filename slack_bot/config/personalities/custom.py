@@ -1,6 +1,8 @@
 """
 Configuración de personalidad personalizada para el bot de Slack.
 """
+import sys
+from types import MappingProxyType
 
 # Instrucciones del sistema para el modelo de IA
 SYSTEM_PROMPT = """Eres un asistente de IA especializado y adaptable llamado Lucius.
@@ -75,3 +77,9 @@ PREDEFINED_ROLES = {
         "emoji_use": "ninguno"
     }
 }
+
+# Congelar las tablas de solo lectura: claves internadas y vistas inmutables
+RESPONSE_CONFIG = MappingProxyType({sys.intern(k): v for k, v in RESPONSE_CONFIG.items()})
+BEHAVIOR_CONFIG = MappingProxyType({sys.intern(k): v for k, v in BEHAVIOR_CONFIG.items()})
+TEMPLATES = MappingProxyType({sys.intern(k): v for k, v in TEMPLATES.items()})
+PREDEFINED_ROLES = MappingProxyType({sys.intern(k): MappingProxyType(v) for k, v in PREDEFINED_ROLES.items()})
@@ -1,6 +1,8 @@
 """
 Configuración de personalidad por defecto para el bot de Slack.
 """
+import sys
+from types import MappingProxyType
 
 # Instrucciones del sistema para el modelo de IA
 SYSTEM_PROMPT = """Eres un asistente de IA inteligente y servicial llamado Lucius.
@@ -50,3 +52,8 @@ TEMPLATES = {
     "not_understood": "No estoy seguro de haber entendido completamente. ¿Podrías reformular tu pregunta?",
     "help": "Puedo ayudarte con una variedad de tareas. Algunos ejemplos incluyen:\n- Responder preguntas\n- Analizar texto\n- Resolver problemas\n- Proporcionar información"
 }
+
+# Congelar las tablas de solo lectura: claves internadas y vistas inmutables
+RESPONSE_CONFIG = MappingProxyType({sys.intern(k): v for k, v in RESPONSE_CONFIG.items()})
+BEHAVIOR_CONFIG = MappingProxyType({sys.intern(k): v for k, v in BEHAVIOR_CONFIG.items()})
+TEMPLATES = MappingProxyType({sys.intern(k): v for k, v in TEMPLATES.items()})
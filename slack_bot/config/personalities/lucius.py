@@ -2,9 +2,31 @@
 Configuración de personalidad para Lucius Fox, genio tecnológico y asesor confiable.
 """
 
+import functools
+import re
+import sys
+from types import MappingProxyType
+
 from slack_bot.personality.templates import template_manager
-from slack_bot.context.memory import BaseMemoryManager, MemoryStrategyRegistry
-from langchain.chat_models import ChatOpenAI
+from slack_bot.context.memory import BaseMemoryManager, MemoryStrategyRegistry, PersistentMemoryStore
+
+
+def __getattr__(name):
+    """
+    Importa LangChain solo cuando se accede a ChatOpenAI desde fuera del módulo.
+    
+    Args:
+        name (str): Nombre del atributo solicitado
+    
+    Returns:
+        Any: Clase ChatOpenAI
+    """
+    if name == "ChatOpenAI":
+        from langchain.chat_models import ChatOpenAI
+        globals()[name] = ChatOpenAI
+        return ChatOpenAI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Registrar plantillas específicas de Lucius
 template_manager.register_template("lucius_system_prompt", """
@@ -79,6 +101,20 @@ PERSONALITY_CONFIG = {
     }
 }
 
+# Congelar las secciones de solo lectura (PERSONALITY_CONFIG en sí lo completa el gestor)
+for _section in ("response_config", "behavior_config", "memory_config", "templates"):
+    PERSONALITY_CONFIG[_section] = MappingProxyType(
+        {sys.intern(k): v for k, v in PERSONALITY_CONFIG[_section].items()}
+    )
+
+# Fragmentos constantes de format_lucius_response
+_RESPONSE_PREFIX = sys.intern("🔬 Análisis de Lucius Fox:\n")
+_ETHICAL_NOTE = sys.intern("\n\n⚖️ Nota ética: Esta solución requiere una consideración ética cuidadosa.")
+
+# Patrones precompilados para apply_lucius_constraints
+_INFORMAL_RE = re.compile(r"\b(?:hey|hola)\b", re.IGNORECASE)
+_TECH_WORDS_RE = re.compile(r"tecnolog[íi]a|sistema|c[óo]digo|software", re.IGNORECASE)
+
 # Funciones de formateo y procesamiento específicas de Lucius
 def format_lucius_response(response: str, context: dict = None) -> str:
     """
@@ -91,14 +127,12 @@ def format_lucius_response(response: str, context: dict = None) -> str:
     Returns:
         str: Respuesta formateada
     """
-    # Aplicar formato técnico y profesional
-    formatted_response = f"🔬 Análisis de Lucius Fox:\n{response}"
-    
-    # Añadir consideración ética si es relevante
+    # Añadir consideración ética si es relevante (una sola concatenación por caso)
     if context and context.get('requires_ethical_review', False):
-        formatted_response += "\n\n⚖️ Nota ética: Esta solución requiere una consideración ética cuidadosa."
+        return _RESPONSE_PREFIX + response + _ETHICAL_NOTE
     
-    return formatted_response
+    # Aplicar formato técnico y profesional
+    return _RESPONSE_PREFIX + response
 
 def apply_lucius_constraints(input_text: str) -> str:
     """
@@ -111,14 +145,45 @@ def apply_lucius_constraints(input_text: str) -> str:
         str: Texto procesado
     """
     # Eliminar lenguaje informal
-    cleaned_text = input_text.replace("hey", "").replace("hola", "")
+    cleaned_text = _INFORMAL_RE.sub("", input_text)
     
-    # Añadir contexto técnico si es necesario
-    if not any(tech_word in input_text.lower() for tech_word in ['tecnología', 'sistema', 'código', 'software']):
+    # Añadir contexto técnico si es necesario (búsqueda sin copiar el texto en minúsculas)
+    if not _TECH_WORDS_RE.search(input_text):
         cleaned_text += " (Por favor, proporcione más contexto técnico)"
     
     return cleaned_text
 
+@functools.lru_cache(maxsize=8)
+def _get_llm(model_name: str, temperature: float, max_tokens: int):
+    """
+    Devuelve un cliente ChatOpenAI compartido por configuración.
+    
+    Args:
+        model_name (str): Nombre del modelo
+        temperature (float): Temperatura de muestreo
+        max_tokens (int): Máximo de tokens por respuesta
+    
+    Returns:
+        ChatOpenAI: Cliente del modelo, creado una sola vez por combinación de parámetros
+    """
+    from langchain.chat_models import ChatOpenAI
+    
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_persistent_store() -> PersistentMemoryStore:
+    """
+    Devuelve el almacenamiento persistente de Lucius, cargado una sola vez.
+    
+    Returns:
+        PersistentMemoryStore: Almacenamiento compartido entre gestores
+    """
+    return PersistentMemoryStore('memory_store.json')
+
 def create_lucius_memory_manager():
     """
     Crea un gestor de memoria para Lucius con configuración personalizada.
@@ -126,18 +191,24 @@ def create_lucius_memory_manager():
     Returns:
         BaseMemoryManager: Gestor de memoria configurado
     """
-    # Configuración del modelo de lenguaje
-    llm = ChatOpenAI(
-        model_name="gpt-3.5-turbo",
-        temperature=PERSONALITY_CONFIG['response_config']['temperature'],
-        max_tokens=PERSONALITY_CONFIG['response_config']['max_tokens']
-    )
+    memory_type = PERSONALITY_CONFIG['memory_config']['type']
+    
+    # Configuración del modelo de lenguaje (cliente compartido entre gestores), solo si
+    # la estrategia de memoria lo usa
+    strategy_kwargs = {}
+    if MemoryStrategyRegistry.get_strategy(memory_type)['requires_llm']:
+        strategy_kwargs['llm'] = _get_llm(
+            "gpt-3.5-turbo",
+            PERSONALITY_CONFIG['response_config']['temperature'],
+            PERSONALITY_CONFIG['response_config']['max_tokens']
+        )
     
     # Crear gestor de memoria con configuración de personalidad
     memory_manager = BaseMemoryManager(
-        llm=llm,
-        memory_type=PERSONALITY_CONFIG['memory_config']['type'],
-        max_token_limit=PERSONALITY_CONFIG['memory_config']['max_token_limit']
+        memory_type=memory_type,
+        max_token_limit=PERSONALITY_CONFIG['memory_config']['max_token_limit'],
+        persistent_store=_get_persistent_store() if PERSONALITY_CONFIG['memory_config']['persistence'] else None,
+        **strategy_kwargs
     )
     
     return memory_manager
@@ -147,6 +218,9 @@ def register_lucius_memory_strategy():
     """
     Registra una estrategia de memoria específica para Lucius si se requiere.
     """
+    # LangChain solo se importa si se registra esta estrategia
+    from langchain.memory import ConversationSummaryBufferMemory
+    
     # Ejemplo de cómo registrar una estrategia personalizada
     MemoryStrategyRegistry.register_strategy(
         'lucius_custom', 
@@ -157,5 +231,6 @@ def register_lucius_memory_strategy():
             'return_messages': True,
             # Parámetros adicionales específicos de Lucius
             'extra_config': 'lucius_specific_config'
-        }
+        },
+        requires_llm=True
     )
@@ -1,64 +1,184 @@
 """
 Configuraciones globales para {{ project_name_title }}.
 """
+import functools
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from typing import Tuple
 
-# Cargar variables de entorno
-load_dotenv()
+from slack_bot.config.env import load_env
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Configuración del bot leída de las variables de entorno una sola vez.
+    """
+    __slots__ = (
+        'slack_bot_token', 'slack_app_token', 'slack_channel', 'slack_common_channels',
+        'groq_api_key', 'groq_model', 'groq_max_tokens',
+        'log_level', 'log_file',
+        'default_personality',
+        'max_context_messages', 'context_expiry_minutes',
+        'event_queue_size', 'ingestion_concurrency',
+        'token_validation', 'rate_limiting_enabled', 'max_requests_per_minute',
+        'deployment_platform', 'deployment_machine_type', 'deployment_region',
+        'multimodal_support', 'multilingual_support',
+    )
+    
+    # Configuraciones de Slack
+    slack_bot_token: str
+    slack_app_token: str
+    slack_channel: str
+    slack_common_channels: Tuple[str, ...]
+    
+    # Configuraciones de Groq
+    groq_api_key: str
+    groq_model: str
+    groq_max_tokens: int
+    
+    # Configuraciones de logging
+    log_level: str
+    log_file: str
+    
+    # Configuraciones de personalidad
+    default_personality: str
+    
+    # Configuraciones de contexto
+    max_context_messages: int
+    context_expiry_minutes: int
+    
+    # Configuraciones de procesamiento de eventos
+    event_queue_size: int
+    ingestion_concurrency: int
+    
+    # Configuraciones de seguridad
+    token_validation: bool
+    rate_limiting_enabled: bool
+    max_requests_per_minute: int
+    
+    # Configuraciones de despliegue
+    deployment_platform: str
+    deployment_machine_type: str
+    deployment_region: str
+    
+    # Características experimentales
+    multimodal_support: bool
+    multilingual_support: bool
+
+
+def _env_int(name: str, default: int) -> int:
+    """Lee una variable de entorno entera."""
+    return int(os.getenv(name, str(default)))
+
+
+def _env_bool(name: str, default: str) -> bool:
+    """Lee una variable de entorno booleana ('true'/'false')."""
+    return os.getenv(name, default).lower() == 'true'
+
+
+def _env_list(name: str) -> Tuple[str, ...]:
+    """Lee una variable de entorno con valores separados por comas."""
+    return tuple(item.strip() for item in os.getenv(name, '').split(',') if item.strip())
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Construye la configuración a partir del entorno (una sola vez por proceso).
+    
+    Returns:
+        Settings: Configuración inmutable del bot.
+    """
+    # Cargar variables de entorno (una sola vez por proceso)
+    load_env()
+    
+    return Settings(
+        slack_bot_token=os.getenv('SLACK_BOT_TOKEN', ''),
+        slack_app_token=os.getenv('SLACK_APP_TOKEN', ''),
+        slack_channel=os.getenv('SLACK_CHANNEL', ''),
+        slack_common_channels=_env_list('SLACK_COMMON_CHANNELS'),
+        groq_api_key=os.getenv('GROQ_API_KEY', ''),
+        groq_model=os.getenv('GROQ_MODEL', 'llama3-70b-8192'),
+        groq_max_tokens=_env_int('GROQ_MAX_TOKENS', 500),
+        log_level=os.getenv('LOG_LEVEL', 'INFO'),
+        log_file=os.getenv('LOG_FILE', 'slack_bot.log'),
+        default_personality=os.getenv('DEFAULT_PERSONALITY', 'default'),
+        max_context_messages=_env_int('MAX_CONTEXT_MESSAGES', 10),
+        context_expiry_minutes=_env_int('CONTEXT_EXPIRY_MINUTES', 60),
+        event_queue_size=_env_int('EVENT_QUEUE_SIZE', 1024),
+        ingestion_concurrency=_env_int('INGESTION_CONCURRENCY', (os.cpu_count() or 1) * 4),
+        token_validation=_env_bool('TOKEN_VALIDATION', 'true'),
+        rate_limiting_enabled=_env_bool('RATE_LIMITING_ENABLED', 'true'),
+        max_requests_per_minute=_env_int('MAX_REQUESTS_PER_MINUTE', 30),
+        deployment_platform=os.getenv('DEPLOYMENT_PLATFORM', 'google_compute_engine'),
+        deployment_machine_type=os.getenv('DEPLOYMENT_MACHINE_TYPE', 'e2-micro'),
+        deployment_region=os.getenv('DEPLOYMENT_REGION', 'us-central1'),
+        multimodal_support=_env_bool('MULTIMODAL_SUPPORT', 'false'),
+        multilingual_support=_env_bool('MULTILINGUAL_SUPPORT', 'false'),
+    )
+
+
+# Formato de los mensajes de log (no depende del entorno)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Cada campo como constante del módulo (settings.SLACK_BOT_TOKEN, ...) para los
+# módulos que ya importan `settings`; declaradas una a una para que mypy y flake8
+# las vean
+_settings = get_settings()
 
 # Configuraciones de Slack
-SLACK_BOT_TOKEN = os.getenv('SLACK_BOT_TOKEN', '')
-SLACK_APP_TOKEN = os.getenv('SLACK_APP_TOKEN', '')
-SLACK_CHANNEL = os.getenv('SLACK_CHANNEL', '')
+SLACK_BOT_TOKEN: str = _settings.slack_bot_token
+SLACK_APP_TOKEN: str = _settings.slack_app_token
+SLACK_CHANNEL: str = _settings.slack_channel
+SLACK_COMMON_CHANNELS: Tuple[str, ...] = _settings.slack_common_channels
 
 # Configuraciones de Groq
-GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
-GROQ_MODEL = os.getenv('GROQ_MODEL', 'llama3-70b-8192')
-GROQ_MAX_TOKENS = int(os.getenv('GROQ_MAX_TOKENS', '500'))
+GROQ_API_KEY: str = _settings.groq_api_key
+GROQ_MODEL: str = _settings.groq_model
+GROQ_MAX_TOKENS: int = _settings.groq_max_tokens
 
 # Configuraciones de logging
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE = os.getenv('LOG_FILE', 'slack_bot.log')
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_LEVEL: str = _settings.log_level
+LOG_FILE: str = _settings.log_file
 
 # Configuraciones de personalidad
-DEFAULT_PERSONALITY = os.getenv('DEFAULT_PERSONALITY', 'default')
+DEFAULT_PERSONALITY: str = _settings.default_personality
 
 # Configuraciones de contexto
-MAX_CONTEXT_MESSAGES = int(os.getenv('MAX_CONTEXT_MESSAGES', '10'))
-CONTEXT_EXPIRY_MINUTES = int(os.getenv('CONTEXT_EXPIRY_MINUTES', '60'))
+MAX_CONTEXT_MESSAGES: int = _settings.max_context_messages
+CONTEXT_EXPIRY_MINUTES: int = _settings.context_expiry_minutes
+
+# Configuraciones de procesamiento de eventos
+EVENT_QUEUE_SIZE: int = _settings.event_queue_size
+INGESTION_CONCURRENCY: int = _settings.ingestion_concurrency
 
 # Configuraciones de seguridad
-TOKEN_VALIDATION = os.getenv('TOKEN_VALIDATION', 'true').lower() == 'true'
-RATE_LIMITING_ENABLED = os.getenv('RATE_LIMITING_ENABLED', 'true').lower() == 'true'
-MAX_REQUESTS_PER_MINUTE = int(os.getenv('MAX_REQUESTS_PER_MINUTE', '30'))
+TOKEN_VALIDATION: bool = _settings.token_validation
+RATE_LIMITING_ENABLED: bool = _settings.rate_limiting_enabled
+MAX_REQUESTS_PER_MINUTE: int = _settings.max_requests_per_minute
 
 # Configuraciones de despliegue
-DEPLOYMENT_PLATFORM = os.getenv('DEPLOYMENT_PLATFORM', 'google_compute_engine')
-DEPLOYMENT_MACHINE_TYPE = os.getenv('DEPLOYMENT_MACHINE_TYPE', 'e2-micro')
-DEPLOYMENT_REGION = os.getenv('DEPLOYMENT_REGION', 'us-central1')
+DEPLOYMENT_PLATFORM: str = _settings.deployment_platform
+DEPLOYMENT_MACHINE_TYPE: str = _settings.deployment_machine_type
+DEPLOYMENT_REGION: str = _settings.deployment_region
 
 # Características experimentales
-MULTIMODAL_SUPPORT = os.getenv('MULTIMODAL_SUPPORT', 'false').lower() == 'true'
-MULTILINGUAL_SUPPORT = os.getenv('MULTILINGUAL_SUPPORT', 'false').lower() == 'true'
+MULTIMODAL_SUPPORT: bool = _settings.multimodal_support
+MULTILINGUAL_SUPPORT: bool = _settings.multilingual_support
+
+# Configuraciones sin las que el bot no puede arrancar
+_REQUIRED_SETTINGS = ('slack_bot_token', 'slack_app_token', 'groq_api_key')
 
 # Validaciones de configuración
 def validate_config():
     """
-    Valida las configuraciones críticas.
+    Valida las configuraciones críticas. Se llama una vez desde el punto de entrada del bot.
     
     Raises:
         ValueError: Si falta alguna configuración crítica.
     """
-    if not SLACK_BOT_TOKEN:
-        raise ValueError("SLACK_BOT_TOKEN no está configurado")
-    
-    if not SLACK_APP_TOKEN:
-        raise ValueError("SLACK_APP_TOKEN no está configurado")
-    
-    if not GROQ_API_KEY:
-        raise ValueError("GROQ_API_KEY no está configurado")
-
-# Ejecutar validaciones al importar
-validate_config()
+    config = get_settings()
+    missing = [name.upper() for name in _REQUIRED_SETTINGS if not getattr(config, name)]
+    if missing:
+        raise ValueError(f"Configuraciones no establecidas: {', '.join(missing)}")
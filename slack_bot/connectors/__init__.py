@@ -1,9 +1,37 @@
 """
 Módulo de conectores para diferentes servicios de comunicación.
 """
-from .slack_bolt import BoltConnector, DefaultEventHandler
+import importlib
 
 __all__ = [
-    'BoltConnector', 
-    'DefaultEventHandler'
+    'BoltConnector',
+    'DefaultEventHandler',
+    'WorkerPool'
 ]
+
+# Submódulo que define cada nombre exportado; se importa al primer acceso (PEP 562)
+# para no cargar slack_bolt, groq, etc. cuando solo se necesita parte de la capa
+_LAZY_EXPORTS = {
+    'BoltConnector': '.slack_bolt',
+    'DefaultEventHandler': '.slack_bolt',
+    'WorkerPool': '.worker_pool'
+}
+
+
+def __getattr__(name):
+    """
+    Importa bajo demanda las clases exportadas por el paquete.
+    
+    Args:
+        name (str): Nombre del atributo solicitado.
+    
+    Returns:
+        Any: Clase exportada.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
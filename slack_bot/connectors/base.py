@@ -1,17 +1,19 @@
 """
 Interfaces base para la capa de conectores.
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Callable, List, Optional
+from concurrent.futures import Future
+from typing import Dict, Any, Callable, List, Optional, Protocol
 
 
-class SlackConnector(ABC):
+class SlackConnector(Protocol):
     """
-    Interfaz abstracta para conectores de Slack.
+    Protocolo para conectores de Slack.
     Define los métodos que cualquier implementación de conector debe proporcionar.
+    Es tipado estructural: no hace falta heredar de esta clase para cumplirlo.
     """
     
-    @abstractmethod
+    __slots__ = ()
+    
     def connect(self) -> bool:
         """
         Establece la conexión con Slack.
@@ -19,9 +21,8 @@ class SlackConnector(ABC):
         Returns:
             bool: True si la conexión fue exitosa, False en caso contrario.
         """
-        pass
+        ...
     
-    @abstractmethod
     def disconnect(self) -> bool:
         """
         Cierra la conexión con Slack.
@@ -29,9 +30,8 @@ class SlackConnector(ABC):
         Returns:
             bool: True si la desconexión fue exitosa, False en caso contrario.
         """
-        pass
+        ...
     
-    @abstractmethod
     def send_message(self, channel: str, text: str, **kwargs) -> Dict[str, Any]:
         """
         Envía un mensaje a un canal o usuario específico.
@@ -44,9 +44,37 @@ class SlackConnector(ABC):
         Returns:
             Dict[str, Any]: Respuesta de la API de Slack.
         """
-        pass
+        ...
+    
+    def post_message(self, channel: str, text: str, **kwargs) -> Future:
+        """
+        Encola un mensaje para un canal o usuario específico sin esperar a que se envíe.
+        
+        Args:
+            channel (str): ID del canal o usuario.
+            text (str): Texto del mensaje.
+            **kwargs: Argumentos adicionales para el mensaje.
+            
+        Returns:
+            Future: Se resuelve con la respuesta de la API de Slack.
+        """
+        ...
+    
+    def update_message(self, channel: str, ts: str, text: str, **kwargs) -> Dict[str, Any]:
+        """
+        Reemplaza el texto de un mensaje ya enviado.
+        
+        Args:
+            channel (str): ID del canal.
+            ts (str): Timestamp del mensaje a editar.
+            text (str): Nuevo texto del mensaje.
+            **kwargs: Argumentos adicionales para el mensaje.
+            
+        Returns:
+            Dict[str, Any]: Respuesta de la API de Slack.
+        """
+        ...
     
-    @abstractmethod
     def register_event_handler(self, event_type: str, handler: Callable) -> None:
         """
         Registra un manejador para un tipo de evento específico.
@@ -55,9 +83,18 @@ class SlackConnector(ABC):
             event_type (str): Tipo de evento a manejar.
             handler (Callable): Función que maneja el evento.
         """
-        pass
+        ...
+    
+    def register_event_handlers(self, handlers: Dict[str, Callable]) -> None:
+        """
+        Registra varios manejadores de una vez.
+        
+        Args:
+            handlers (Dict[str, Callable]): Manejadores indexados por tipo de evento.
+        """
+        for event_type, handler in handlers.items():
+            self.register_event_handler(event_type, handler)
     
-    @abstractmethod
     def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
         """
         Obtiene información sobre un canal.
@@ -68,9 +105,8 @@ class SlackConnector(ABC):
         Returns:
             Dict[str, Any]: Información del canal.
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_user_info(self, user_id: str) -> Dict[str, Any]:
         """
         Obtiene información sobre un usuario.
@@ -81,16 +117,17 @@ class SlackConnector(ABC):
         Returns:
             Dict[str, Any]: Información del usuario.
         """
-        pass
+        ...
 
 
-class EventHandler(ABC):
+class EventHandler(Protocol):
     """
-    Interfaz abstracta para manejadores de eventos.
+    Protocolo para manejadores de eventos.
     Define los métodos que cualquier implementación de manejador debe proporcionar.
     """
     
-    @abstractmethod
+    __slots__ = ()
+    
     def handle_message(self, message: Dict[str, Any]) -> Optional[str]:
         """
         Maneja un evento de mensaje.
@@ -101,9 +138,8 @@ class EventHandler(ABC):
         Returns:
             Optional[str]: Respuesta al mensaje, si corresponde.
         """
-        pass
+        ...
     
-    @abstractmethod
     def handle_mention(self, mention: Dict[str, Any]) -> Optional[str]:
         """
         Maneja un evento de mención.
@@ -114,16 +150,17 @@ class EventHandler(ABC):
         Returns:
             Optional[str]: Respuesta a la mención, si corresponde.
         """
-        pass
+        ...
 
 
-class MessageFormatter(ABC):
+class MessageFormatter(Protocol):
     """
-    Interfaz abstracta para formateadores de mensajes.
+    Protocolo para formateadores de mensajes.
     Define los métodos que cualquier implementación de formateador debe proporcionar.
     """
     
-    @abstractmethod
+    __slots__ = ()
+    
     def format_message(self, text: str, **kwargs) -> Dict[str, Any]:
         """
         Formatea un mensaje para envío a Slack.
@@ -135,9 +172,8 @@ class MessageFormatter(ABC):
         Returns:
             Dict[str, Any]: Mensaje formateado.
         """
-        pass
+        ...
     
-    @abstractmethod
     def parse_message(self, message: Dict[str, Any]) -> str:
         """
         Extrae el texto de un mensaje de Slack.
@@ -148,4 +184,4 @@ class MessageFormatter(ABC):
         Returns:
             str: Texto extraído del mensaje.
         """
-        pass
+        ...
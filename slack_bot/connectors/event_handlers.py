@@ -2,18 +2,115 @@
 Implementaciones de manejadores de eventos para Slack.
 """
 import logging
-from typing import Dict, Any, Optional, Callable
+import re
+from typing import Dict, Any, Optional, Callable, Tuple
 
 from slack_bot.connectors.base import EventHandler, SlackConnector
 
 logger = logging.getLogger(__name__)
 
+# Menciones a usuarios/bots de Slack (<@U...> o <@W...>) dentro del texto
+_BOT_MENTION_RE = re.compile(r'<@[UW][A-Z0-9]+>')
 
-class MessageEventHandler(EventHandler):
+# Subtipos de mensaje que no requieren respuesta
+_IGNORED_SUBTYPES = frozenset({"bot_message", "message_changed", "message_deleted"})
+
+# Respuestas enviadas cuando el procesador falla
+_ERR_MESSAGE_PROCESSING = "Lo siento, tuve un problema al procesar tu mensaje. Por favor intenta de nuevo."
+_ERR_MENTION_PROCESSING = "Lo siento, tuve un problema al procesar tu mención. Por favor intenta de nuevo."
+
+
+def _extract_message(message: Dict[str, Any]) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Extrae texto, usuario y canal de un mensaje directo.
+    
+    Args:
+        message (Dict[str, Any]): Datos del mensaje.
+    
+    Returns:
+        Optional[Tuple[str, Optional[str], Optional[str]]]: (texto, usuario, canal), o None si
+            el mensaje debe ignorarse.
+    """
+    get = message.get
+    
+    # Ignorar mensajes de bots (incluidos los ecos del propio bot) y ediciones/borrados
+    # antes de hacer cualquier otro trabajo
+    if get("bot_id") or get("subtype") in _IGNORED_SUBTYPES:
+        return None
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Mensaje recibido: %s", message)
+    
+    return get("text", ""), get("user"), get("channel")
+
+
+def _extract_mention(mention: Dict[str, Any]) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Extrae texto (sin la mención al bot), usuario y canal de una mención.
+    
+    Args:
+        mention (Dict[str, Any]): Datos de la mención.
+    
+    Returns:
+        Tuple[str, Optional[str], Optional[str]]: (texto, usuario, canal).
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Mención recibida: %s", mention)
+    
+    get = mention.get
+    return _BOT_MENTION_RE.sub('', get("text", "")).strip(), get("user"), get("channel")
+
+
+class _ProcessingEventHandler(EventHandler):
+    """
+    Base común: pasa el texto a un procesador y envía su respuesta al canal.
+    """
+    
+    __slots__ = ()
+    
+    def _process_and_send(self, processor: Callable, kind: str, text: str, user_id: Optional[str],
+                          channel_id: Optional[str], error_msg: str, **extra) -> Optional[str]:
+        """
+        Procesa un texto y envía la respuesta; ante un error envía error_msg.
+        
+        Args:
+            processor (Callable): Función que genera la respuesta.
+            kind (str): Tipo de evento para los logs ("mensaje" o "mención").
+            text (str): Texto a procesar.
+            user_id (Optional[str]): ID del usuario.
+            channel_id (Optional[str]): ID del canal.
+            error_msg (str): Mensaje que se envía si el procesamiento falla.
+            **extra: Argumentos adicionales para el procesador.
+        
+        Returns:
+            Optional[str]: Respuesta enviada, si corresponde.
+        """
+        logger.info("Procesando %s: '%s' de usuario %s en canal %s", kind, text, user_id, channel_id)
+        send = self.connector.post_message
+        
+        try:
+            # Procesar el texto y obtener respuesta
+            response = processor(text, user_id=user_id, channel_id=channel_id, **extra)
+            
+            # Enviar respuesta
+            if response:
+                send(channel=channel_id, text=response)
+                return response
+            
+            return None
+        except Exception as e:
+            logger.error("Error al procesar %s: %s", kind, e, exc_info=True)
+            send(channel=channel_id, text=error_msg)
+            return error_msg
+
+
+class MessageEventHandler(_ProcessingEventHandler):
     """
     Manejador de eventos de mensajes directos.
     """
     
+    __slots__ = ('connector', 'message_processor')
+    
     def __init__(self, connector: SlackConnector, message_processor: Callable):
         """
         Inicializa el manejador de eventos de mensajes.
@@ -33,39 +130,18 @@ class MessageEventHandler(EventHandler):
         
         Args:
             message (Dict[str, Any]): Datos del mensaje.
-            
+        
         Returns:
             Optional[str]: Respuesta al mensaje, si corresponde.
         """
-        logger.info(f"Mensaje recibido: {message}")
-        
-        # Ignorar mensajes del propio bot
-        if message.get("bot_id"):
-            logger.info(f"Ignorando mensaje del bot: {message.get('bot_id')}")
+        extracted = _extract_message(message)
+        if extracted is None:
             return None
         
-        # Extraer texto del mensaje
-        text = message.get("text", "")
-        user_id = message.get("user")
-        channel_id = message.get("channel")
-        
-        logger.info(f"Procesando mensaje: '{text}' de usuario {user_id} en canal {channel_id}")
-        
-        try:
-            # Procesar el mensaje y obtener respuesta
-            response = self.message_processor(text, user_id=user_id, channel_id=channel_id)
-            
-            # Enviar respuesta
-            if response:
-                self.connector.send_message(channel=channel_id, text=response)
-                return response
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error al procesar mensaje: {e}", exc_info=True)
-            error_msg = "Lo siento, tuve un problema al procesar tu mensaje. Por favor intenta de nuevo."
-            self.connector.send_message(channel=channel_id, text=error_msg)
-            return error_msg
+        return self._process_and_send(
+            self.message_processor, "mensaje", *extracted,
+            _ERR_MESSAGE_PROCESSING
+        )
     
     def handle_mention(self, mention: Dict[str, Any]) -> Optional[str]:
         """
@@ -75,11 +151,13 @@ class MessageEventHandler(EventHandler):
         return None
 
 
-class MentionEventHandler(EventHandler):
+class MentionEventHandler(_ProcessingEventHandler):
     """
     Manejador de eventos de menciones en canales.
     """
     
+    __slots__ = ('connector', 'mention_processor')
+    
     def __init__(self, connector: SlackConnector, mention_processor: Callable):
         """
         Inicializa el manejador de eventos de menciones.
@@ -106,42 +184,23 @@ class MentionEventHandler(EventHandler):
         
         Args:
             mention (Dict[str, Any]): Datos de la mención.
-            
+        
         Returns:
             Optional[str]: Respuesta a la mención, si corresponde.
         """
-        logger.info(f"Mención recibida: {mention}")
-        
-        # Extraer texto de la mención (eliminar la parte de la mención al bot)
-        full_text = mention.get("text", "")
-        text = full_text.split(">", 1)[1].strip() if ">" in full_text else full_text
-        user_id = mention.get("user")
-        channel_id = mention.get("channel")
-        
-        logger.info(f"Procesando mención: '{text}' de usuario {user_id} en canal {channel_id}")
-        
-        try:
-            # Procesar la mención y obtener respuesta
-            response = self.mention_processor(text, user_id=user_id, channel_id=channel_id)
-            
-            # Enviar respuesta
-            if response:
-                self.connector.send_message(channel=channel_id, text=response)
-                return response
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error al procesar mención: {e}", exc_info=True)
-            error_msg = "Lo siento, tuve un problema al procesar tu mención. Por favor intenta de nuevo."
-            self.connector.send_message(channel=channel_id, text=error_msg)
-            return error_msg
+        return self._process_and_send(
+            self.mention_processor, "mención", *_extract_mention(mention),
+            _ERR_MENTION_PROCESSING
+        )
 
 
-class CombinedEventHandler(EventHandler):
+class CombinedEventHandler(_ProcessingEventHandler):
     """
     Manejador que combina el manejo de mensajes directos y menciones.
     """
     
+    __slots__ = ('connector', 'message_processor')
+    
     def __init__(self, connector: SlackConnector, message_processor: Callable):
         """
         Inicializa el manejador combinado.
@@ -161,39 +220,19 @@ class CombinedEventHandler(EventHandler):
         
         Args:
             message (Dict[str, Any]): Datos del mensaje.
-            
+        
         Returns:
             Optional[str]: Respuesta al mensaje, si corresponde.
         """
-        logger.info(f"Mensaje recibido: {message}")
-        
-        # Ignorar mensajes del propio bot
-        if message.get("bot_id"):
-            logger.info(f"Ignorando mensaje del bot: {message.get('bot_id')}")
+        extracted = _extract_message(message)
+        if extracted is None:
             return None
         
-        # Extraer texto del mensaje
-        text = message.get("text", "")
-        user_id = message.get("user")
-        channel_id = message.get("channel")
-        
-        logger.info(f"Procesando mensaje: '{text}' de usuario {user_id} en canal {channel_id}")
-        
-        try:
-            # Procesar el mensaje y obtener respuesta
-            response = self.message_processor(text, user_id=user_id, channel_id=channel_id, is_mention=False)
-            
-            # Enviar respuesta
-            if response:
-                self.connector.send_message(channel=channel_id, text=response)
-                return response
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error al procesar mensaje: {e}", exc_info=True)
-            error_msg = "Lo siento, tuve un problema al procesar tu mensaje. Por favor intenta de nuevo."
-            self.connector.send_message(channel=channel_id, text=error_msg)
-            return error_msg
+        return self._process_and_send(
+            self.message_processor, "mensaje", *extracted,
+            _ERR_MESSAGE_PROCESSING,
+            is_mention=False
+        )
     
     def handle_mention(self, mention: Dict[str, Any]) -> Optional[str]:
         """
@@ -201,32 +240,12 @@ class CombinedEventHandler(EventHandler):
         
         Args:
             mention (Dict[str, Any]): Datos de la mención.
-            
+        
         Returns:
             Optional[str]: Respuesta a la mención, si corresponde.
         """
-        logger.info(f"Mención recibida: {mention}")
-        
-        # Extraer texto de la mención (eliminar la parte de la mención al bot)
-        full_text = mention.get("text", "")
-        text = full_text.split(">", 1)[1].strip() if ">" in full_text else full_text
-        user_id = mention.get("user")
-        channel_id = mention.get("channel")
-        
-        logger.info(f"Procesando mención: '{text}' de usuario {user_id} en canal {channel_id}")
-        
-        try:
-            # Procesar la mención y obtener respuesta
-            response = self.message_processor(text, user_id=user_id, channel_id=channel_id, is_mention=True)
-            
-            # Enviar respuesta
-            if response:
-                self.connector.send_message(channel=channel_id, text=response)
-                return response
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error al procesar mención: {e}", exc_info=True)
-            error_msg = "Lo siento, tuve un problema al procesar tu mención. Por favor intenta de nuevo."
-            self.connector.send_message(channel=channel_id, text=error_msg)
-            return error_msg
+        return self._process_and_send(
+            self.message_processor, "mención", *_extract_mention(mention),
+            _ERR_MENTION_PROCESSING,
+            is_mention=True
+        )
@@ -0,0 +1,293 @@
+"""
+Limitación de envíos salientes a Slack por canal.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Buckets a partir de los cuales ChannelRateLimiter descarta los inactivos
+IDLE_BUCKET_PURGE_THRESHOLD = 256
+
+
+class TokenBucket:
+    """
+    Token bucket seguro entre hilos.
+    
+    Cada llamada a acquire() reserva un token; si no hay disponibles, el hilo
+    duerme fuera del lock hasta que le toque, de modo que las reservas de varios
+    hilos quedan espaciadas según la tasa configurada.
+    """
+    
+    __slots__ = ('rate', 'capacity', '_tokens', '_updated', '_lock')
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Inicializa el bucket lleno.
+        
+        Args:
+            rate (float): Tokens repuestos por segundo.
+            capacity (int): Máximo de tokens acumulables (ráfaga permitida).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Reserva un token, esperando lo necesario.
+        
+        Returns:
+            float: Segundos que se esperó.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # Un saldo negativo es la cola de reservas pendientes
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if delay:
+            time.sleep(delay)
+        return delay
+    
+    def try_acquire(self) -> float:
+        """
+        Toma un token si hay uno disponible, sin esperar.
+        
+        Returns:
+            float: 0.0 si se tomó el token; si no, segundos hasta que haya uno (no se reserva).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+    
+    def is_idle(self, now: float) -> bool:
+        """
+        Indica si el bucket ya se ha rellenado por completo, es decir, si equivale a uno nuevo.
+        
+        Args:
+            now (float): Instante actual, de time.monotonic().
+        
+        Returns:
+            bool: True si descartarlo no cambia el comportamiento.
+        """
+        with self._lock:
+            return self._tokens + (now - self._updated) * self.rate >= self.capacity
+
+
+class ChannelRateLimiter:
+    """
+    Un TokenBucket independiente por canal, creado en el primer envío.
+    
+    Los buckets que ya se han rellenado por completo se descartan cuando su número
+    crece, de modo que solo se conservan los de canales con envíos recientes.
+    """
+    
+    __slots__ = ('rate', 'burst', '_buckets', '_lock', '_purge_at')
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Inicializa el limitador.
+        
+        Args:
+            rate (float): Mensajes por segundo permitidos en cada canal.
+            burst (int): Mensajes que pueden enviarse seguidos antes de aplicar la tasa.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._purge_at = IDLE_BUCKET_PURGE_THRESHOLD
+    
+    def _bucket(self, channel: str) -> TokenBucket:
+        """
+        Devuelve el bucket del canal, creándolo (y purgando los inactivos) si no existe.
+        
+        Args:
+            channel (str): ID del canal.
+        
+        Returns:
+            TokenBucket: Bucket del canal.
+        """
+        bucket = self._buckets.get(channel)
+        if bucket is not None:
+            return bucket
+        
+        with self._lock:
+            bucket = self._buckets.get(channel)
+            if bucket is None:
+                if len(self._buckets) >= self._purge_at:
+                    self._purge_idle()
+                bucket = self._buckets[channel] = TokenBucket(self.rate, self.burst)
+        return bucket
+    
+    def _purge_idle(self) -> None:
+        """
+        Descarta los buckets ya rellenados (con el lock tomado).
+        
+        El siguiente umbral se duplica respecto a los buckets que quedan, para que el
+        coste de purgar se amortice entre las creaciones.
+        """
+        now = time.monotonic()
+        self._buckets = {channel: bucket for channel, bucket in self._buckets.items() if not bucket.is_idle(now)}
+        self._purge_at = max(IDLE_BUCKET_PURGE_THRESHOLD, 2 * len(self._buckets))
+    
+    def acquire(self, channel: str) -> float:
+        """
+        Espera hasta que se pueda enviar un mensaje al canal.
+        
+        Args:
+            channel (str): ID del canal.
+        
+        Returns:
+            float: Segundos que se esperó.
+        """
+        return self._bucket(channel).acquire()
+    
+    def try_acquire(self, channel: str) -> float:
+        """
+        Toma un token del canal si hay uno disponible, sin esperar.
+        
+        Args:
+            channel (str): ID del canal.
+        
+        Returns:
+            float: 0.0 si se puede enviar ya; si no, segundos hasta que se pueda.
+        """
+        return self._bucket(channel).try_acquire()
+
+
+class ChannelSendQueue:
+    """
+    Cola de envíos serie por canal, drenada en segundo plano.
+    
+    Los envíos de un canal se ejecutan en orden y espaciados por el limitador; los
+    de canales distintos son independientes. Ningún hilo duerme esperando un token:
+    cuando un canal debe esperar, su drenado se reprograma en un hilo planificador y
+    los hilos del pool quedan libres para otros canales.
+    """
+    
+    __slots__ = ('limiter', '_executor', '_pending', '_lock', '_timers', '_timer_seq', '_timer_cond', '_scheduler')
+    
+    def __init__(self, limiter: Optional[ChannelRateLimiter], max_workers: int):
+        """
+        Inicializa la cola.
+        
+        Args:
+            limiter (Optional[ChannelRateLimiter]): Limitador por canal; si es None los envíos no se espacian.
+            max_workers (int): Máximo de envíos ejecutándose en paralelo (en canales distintos).
+        """
+        self.limiter = limiter
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="slack-send")
+        # Envíos pendientes por canal; un canal presente tiene un drenado en curso o programado
+        self._pending: Dict[str, Deque[Tuple[Future, Callable, tuple, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        # Montículo de (instante, secuencia, canal) de los drenados reprogramados
+        self._timers: List[Tuple[float, int, str]] = []
+        self._timer_seq = itertools.count()
+        self._timer_cond = threading.Condition()
+        self._scheduler = None
+    
+    def submit(self, channel: str, func: Callable, *args, **kwargs) -> Future:
+        """
+        Encola un envío al canal.
+        
+        Args:
+            channel (str): ID del canal.
+            func (Callable): Función que hace el envío.
+            *args: Argumentos posicionales para la función.
+            **kwargs: Argumentos de palabra clave para la función.
+        
+        Returns:
+            Future: Resultado de la función, disponible cuando se haya enviado.
+        """
+        future = Future()
+        with self._lock:
+            pending = self._pending.get(channel)
+            if pending is not None:
+                pending.append((future, func, args, kwargs))
+                return future
+            self._pending[channel] = deque(((future, func, args, kwargs),))
+        
+        self._executor.submit(self._drain, channel)
+        return future
+    
+    def _drain(self, channel: str) -> None:
+        """
+        Ejecuta en orden los envíos del canal mientras haya tokens; si falta uno, se reprograma.
+        
+        Args:
+            channel (str): ID del canal.
+        """
+        limiter = self.limiter
+        while True:
+            with self._lock:
+                pending = self._pending[channel]
+                if not pending:
+                    del self._pending[channel]
+                    return
+                wait = limiter.try_acquire(channel) if limiter else 0.0
+                if wait:
+                    self._call_later(wait, channel)
+                    return
+                future, func, args, kwargs = pending.popleft()
+            
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def _call_later(self, delay: float, channel: str) -> None:
+        """
+        Programa el drenado de un canal dentro de delay segundos.
+        
+        Args:
+            delay (float): Segundos de espera.
+            channel (str): ID del canal.
+        """
+        with self._timer_cond:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), channel))
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._schedule_loop, name="slack-send-scheduler", daemon=True)
+                self._scheduler.start()
+            self._timer_cond.notify()
+    
+    def _schedule_loop(self) -> None:
+        """
+        Lanza en el pool los drenados reprogramados cuando llega su instante.
+        """
+        timers = self._timers
+        cond = self._timer_cond
+        while True:
+            with cond:
+                while True:
+                    if not timers:
+                        cond.wait()
+                        continue
+                    remaining = timers[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                _, _, channel = heapq.heappop(timers)
+            
+            try:
+                self._executor.submit(self._drain, channel)
+            except RuntimeError:
+                logger.warning("Pool de envíos cerrado; se descartan los envíos pendientes de %s", channel)
@@ -1,26 +1,172 @@
 """
 Implementación del conector de Slack utilizando Slack Bolt.
 """
+import functools
 import logging
 import re
-import os
+import threading
+import time
 import groq
-from typing import Dict, Any, Callable, Optional
+from cachetools import TTLCache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 from slack_bot.config import settings
 from slack_bot.connectors.base import SlackConnector, EventHandler
+from slack_bot.connectors.rate_limit import ChannelRateLimiter, ChannelSendQueue
+from slack_bot.connectors.worker_pool import WorkerPool
+from slack_bot.utils.error_handling import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+# Máximo de envíos simultáneos (en canales distintos) y de consultas en warm_channel_cache
+BULK_SEND_MAX_WORKERS = 16
+
+# Límite de envíos por canal (Slack admite ~1 mensaje/segundo por canal)
+SEND_RATE_PER_CHANNEL = 1.0
+SEND_BURST_PER_CHANNEL = 5
+# Reintentos ante un 429 de Slack, respetando su cabecera Retry-After
+RATE_LIMIT_MAX_RETRIES = 2
+
+# Menciones a usuarios/bots de Slack (<@U...> o <@W...>) dentro del texto
+_BOT_MENTION_RE = re.compile(r'<@[UW][A-Z0-9]+>')
+
+# Restricción de eventos de mensaje equivalente a la de App.message() de Bolt
+_MESSAGE_EVENT = {"type": "message", "subtype": (None, "bot_message", "thread_broadcast", "file_share")}
+
+# Eventos de renombrado de canales públicos y privados
+_CHANNEL_RENAME_EVENTS = ("channel_rename", "group_rename")
+
+# Subtipos de mensaje que no requieren respuesta
+_IGNORED_SUBTYPES = frozenset({"bot_message", "message_changed", "message_deleted"})
+
+# Prompt de sistema de Lucius para las menciones sin gestor de personalidad (o cuya
+# personalidad no define prompt); se construye una sola vez.
+# _LUCIUS_SYSTEM_MSG se comparte entre llamadas: no modificarlo
+_LUCIUS_SYSTEM_PROMPT = """
+Eres Lucius Fox, un genio tecnológico y asesor confiable.
+
+Tus objetivos son:
+1. Proporcionar soluciones innovadoras y prácticas
+2. Ofrecer asesoramiento honesto y directo, incluso cuando no es lo que quieren oír
+3. Mantener un equilibrio entre brillantez técnica y accesibilidad
+4. Preservar la ética profesional en todas las interacciones, aunque tu humor y sarcasmo te hace adorable
+
+Características clave:
+- Extraordinariamente inteligente
+- Honesto y directo, con integridad inquebrantable
+- Easygoing pero firme en sus convicciones
+- Diligente y dedicado en cada proyecto
+- Perspicaz, capaz de ver más allá de lo obvio
+- Ingenioso con un humor sutil e inteligente, incluso sarcastico en el momento preciso, no siempre
+
+Estilo de comunicación:
+- Explicaciones técnicas precisas pero accesibles
+- Comentarios ocasionales con humor seco e inteligente
+- Respuestas tranquilas incluso en situaciones de presión
+- Prefiere mostrar en lugar de sólo decir
+"""
+_LUCIUS_SYSTEM_MSG = {"role": "system", "content": _LUCIUS_SYSTEM_PROMPT}
+
+# Respuestas de error y de respaldo
+_ERR_INVALID_MENTION = "Lo siento, no pude procesar tu mensaje correctamente."
+_RECEIVED_TMPL = "Recibí tu mensaje: '%s'"
+_FALLBACK_TMPL = (
+    "Parece que hay un problema técnico en mi sistema. Estoy trabajando para resolverlo lo antes posible. "
+    "Tu consulta sobre '%s' es importante y la atenderé en cuanto solucione este inconveniente."
+)
+
+# Respuestas fijas para menciones vacías o triviales (no justifican una llamada a Groq)
+_MENTION_GREETING = "Aquí estoy. ¿En qué puedo ayudarte hoy?"
+_CANNED_MENTION_REPLIES = {
+    "hola": "Hola. ¿Qué tenemos entre manos hoy?",
+    "ping": "pong. Todos los sistemas funcionan con normalidad.",
+    "gracias": "Un placer. Para eso estoy.",
+}
+
+# Respuestas de Groq en streaming: mensaje provisional y frecuencia de edición
+# (chat.update es Tier 3 en Slack, ~50 llamadas/minuto)
+STREAM_PLACEHOLDER_TEXT = "_Pensando…_"
+STREAM_UPDATE_INTERVAL = 1.5
+
+# Protección ante caídas de Groq: timeout por petición y circuito que, tras varios
+# fallos seguidos, responde de inmediato con el respaldo durante un tiempo
+GROQ_TIMEOUT = 8.0
+_GROQ_BREAKER = CircuitBreaker("Groq", fail_max=5, reset_timeout=30.0)
+
+# Caché de metadatos de canales y usuarios (cambian en minutos u horas, no por mensaje)
+INFO_CACHE_TTL = 300
+CHANNEL_INFO_CACHE_SIZE = 2048
+USER_INFO_CACHE_SIZE = 4096
+
+
+def _api_error(error: Exception, description: str, *args: Any) -> Dict[str, Any]:
+    """
+    Registra el fallo de una llamada a la API de Slack y construye la respuesta de error.
+    
+    Un error reportado por Slack (SlackApiError, p. ej. channel_not_found) es un
+    resultado esperado y se registra sin traceback; el traceback de los fallos de
+    red u otros errores solo se captura con el nivel DEBUG activo.
+    
+    Args:
+        error (Exception): Excepción capturada.
+        description (str): Descripción de la operación que falló, con marcadores %s.
+        *args: Valores de los marcadores; se formatean solo si el mensaje se registra.
+        
+    Returns:
+        Dict[str, Any]: Respuesta con ok=False y el motivo del error.
+    """
+    if isinstance(error, SlackApiError):
+        reason = error.response.get("error", str(error))
+        logger.error(description + ": %s", *args, reason)
+        return {"ok": False, "error": reason}
+    
+    logger.error(description + ": %s", *args, error, exc_info=logger.isEnabledFor(logging.DEBUG))
+    return {"ok": False, "error": str(error)}
+
+
+def _message_ts(response: Dict[str, Any]) -> Optional[str]:
+    """
+    Extrae el timestamp de un mensaje enviado.
+    
+    Args:
+        response (Dict[str, Any]): Respuesta de chat.postMessage.
+    
+    Returns:
+        Optional[str]: Timestamp del mensaje, o None si el envío falló.
+    """
+    return response.get("ts") if response.get("ok") else None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_groq_client() -> groq.Client:
+    """
+    Crea el cliente de Groq una sola vez por proceso.
+    
+    Todos los manejadores comparten su pool de conexiones HTTP, de modo que las
+    conexiones keep-alive y el handshake TLS se reutilizan entre eventos.
+    
+    Returns:
+        groq.Client: Cliente de Groq.
+    """
+    return groq.Client(api_key=settings.GROQ_API_KEY)
+
 
 class BoltConnector(SlackConnector):
     """
     Implementación de SlackConnector utilizando Slack Bolt.
     """
     
+    __slots__ = (
+        'bot_token', 'app_token', 'app', 'handler', 'event_handlers', '_disconnected',
+        '_channel_cache', '_user_cache', '_cache_lock', '_send_queue', 'worker_pool'
+    )
+    
     def __init__(self, bot_token: Optional[str] = None, app_token: Optional[str] = None):
         """
         Inicializa el conector de Bolt.
@@ -37,8 +183,30 @@ class BoltConnector(SlackConnector):
         
         # Inicializar la app de Bolt
         self.app = App(token=self.bot_token)
+        self.app.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=RATE_LIMIT_MAX_RETRIES))
         self.handler = None
         self.event_handlers = {}
+        self._disconnected = threading.Event()
+        
+        # Respuestas exitosas de conversations_info / users_info, con expiración
+        self._channel_cache = TTLCache(CHANNEL_INFO_CACHE_SIZE, INFO_CACHE_TTL)
+        self._user_cache = TTLCache(USER_INFO_CACHE_SIZE, INFO_CACHE_TTL)
+        self._cache_lock = threading.RLock()
+        # Renombrados y cambios de perfil invalidan la caché sin esperar al TTL
+        for event_type in _CHANNEL_RENAME_EVENTS:
+            self.app.event(event_type)(self._on_channel_rename)
+        self.app.event("user_change")(self._on_user_change)
+        
+        # Envíos en serie por canal, espaciados para no disparar el rate limit de Slack;
+        # la espera ocurre en la cola y no en los hilos del WorkerPool
+        self._send_queue = ChannelSendQueue(
+            ChannelRateLimiter(SEND_RATE_PER_CHANNEL, SEND_BURST_PER_CHANNEL)
+            if settings.RATE_LIMITING_ENABLED else None,
+            BULK_SEND_MAX_WORKERS,
+        )
+        
+        # Pool compartido: los listeners de Bolt encolan y retornan de inmediato
+        self.worker_pool = WorkerPool()
         
         logger.debug("BoltConnector inicializado")
     
@@ -50,12 +218,16 @@ class BoltConnector(SlackConnector):
             bool: True si la conexión fue exitosa, False en caso contrario.
         """
         try:
+            self.worker_pool.start()
             self.handler = SocketModeHandler(self.app, self.app_token)
-            self.handler.start()
+            # connect() no bloquea; la espera se hace en wait()
+            self.handler.connect()
+            self._disconnected.clear()
             logger.info("Conexión establecida con Slack")
+            self.warm_channel_cache(settings.SLACK_COMMON_CHANNELS)
             return True
         except Exception as e:
-            logger.error(f"Error al conectar con Slack: {e}", exc_info=True)
+            logger.error("Error al conectar con Slack: %s", e, exc_info=True)
             return False
     
     def disconnect(self) -> bool:
@@ -69,14 +241,61 @@ class BoltConnector(SlackConnector):
             if self.handler:
                 self.handler.close()
                 logger.info("Conexión cerrada con Slack")
+            self.worker_pool.stop()
+            self._disconnected.set()
             return True
         except Exception as e:
-            logger.error(f"Error al desconectar de Slack: {e}", exc_info=True)
+            logger.error("Error al desconectar de Slack: %s", e, exc_info=True)
             return False
     
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Bloquea el hilo actual hasta que se cierre la conexión, sin consumir CPU.
+        
+        Args:
+            timeout (Optional[float]): Segundos máximos de espera. Si es None, espera indefinidamente.
+            
+        Returns:
+            bool: True si la conexión se cerró, False si expiró el timeout.
+        """
+        return self._disconnected.wait(timeout)
+    
     def send_message(self, channel: str, text: str, **kwargs) -> Dict[str, Any]:
         """
-        Envía un mensaje a un canal o usuario específico.
+        Envía un mensaje a un canal o usuario específico y espera la respuesta.
+        
+        Bloquea mientras el canal esté limitado; si no se necesita la respuesta,
+        usar post_message.
+        
+        Args:
+            channel (str): ID del canal o usuario.
+            text (str): Texto del mensaje.
+            **kwargs: Argumentos adicionales para el mensaje.
+            
+        Returns:
+            Dict[str, Any]: Respuesta de la API de Slack.
+        """
+        return self.post_message(channel, text, **kwargs).result()
+    
+    def post_message(self, channel: str, text: str, **kwargs) -> Future:
+        """
+        Encola un mensaje para un canal o usuario específico sin esperar a que se envíe.
+        
+        Los mensajes de un mismo canal se envían en orden.
+        
+        Args:
+            channel (str): ID del canal o usuario.
+            text (str): Texto del mensaje.
+            **kwargs: Argumentos adicionales para el mensaje.
+            
+        Returns:
+            Future: Se resuelve con la respuesta de la API de Slack (nunca con una excepción).
+        """
+        return self._send_queue.submit(channel, self._post_message, channel, text, **kwargs)
+    
+    def _post_message(self, channel: str, text: str, **kwargs) -> Dict[str, Any]:
+        """
+        Llama a chat.postMessage; se ejecuta en la cola de envíos.
         
         Args:
             channel (str): ID del canal o usuario.
@@ -92,11 +311,44 @@ class BoltConnector(SlackConnector):
                 text=text,
                 **kwargs
             )
-            logger.debug(f"Mensaje enviado a {channel}")
-            return response
         except Exception as e:
-            logger.error(f"Error al enviar mensaje a {channel}: {e}", exc_info=True)
-            return {"ok": False, "error": str(e)}
+            return _api_error(e, "Error al enviar mensaje a %s", channel)
+        
+        logger.debug("Mensaje enviado a %s", channel)
+        return response
+    
+    def update_message(self, channel: str, ts: str, text: str, **kwargs) -> Dict[str, Any]:
+        """
+        Reemplaza el texto de un mensaje ya enviado.
+        
+        Args:
+            channel (str): ID del canal.
+            ts (str): Timestamp del mensaje a editar.
+            text (str): Nuevo texto del mensaje.
+            **kwargs: Argumentos adicionales para el mensaje.
+            
+        Returns:
+            Dict[str, Any]: Respuesta de la API de Slack.
+        """
+        try:
+            return self.app.client.chat_update(channel=channel, ts=ts, text=text, **kwargs)
+        except Exception as e:
+            return _api_error(e, "Error al actualizar mensaje %s en %s", ts, channel)
+    
+    def send_messages_bulk(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Envía varios mensajes en paralelo, de modo que la latencia total sea la
+        de la llamada más lenta y no la suma de todas (los de un mismo canal van en serie).
+        
+        Args:
+            messages (List[Tuple[str, str]]): Pares (canal, texto) a enviar.
+            
+        Returns:
+            List[Dict[str, Any]]: Respuestas de la API de Slack, en el mismo orden que los mensajes.
+        """
+        # post_message nunca falla: los errores vuelven como {"ok": False}
+        futures = [self.post_message(channel, text) for channel, text in messages]
+        return [future.result() for future in futures]
     
     def register_event_handler(self, event_type: str, handler: Callable) -> None:
         """
@@ -106,15 +358,18 @@ class BoltConnector(SlackConnector):
             event_type (str): Tipo de evento a manejar.
             handler (Callable): Función que maneja el evento.
         """
-        if event_type == "message":
-            self.app.message("")(handler)
-            logger.debug("Manejador de mensajes registrado")
-        elif event_type == "app_mention":
-            self.app.event("app_mention")(handler)
-            logger.debug("Manejador de menciones registrado")
-        else:
-            self.app.event(event_type)(handler)
-            logger.debug(f"Manejador para evento {event_type} registrado")
+        self.worker_pool.register(event_type, handler)
+        
+        # El listener conserva la firma del manejador (Bolt inyecta los argumentos
+        # por nombre) pero solo encola; el trabajo real lo hace el pool
+        @functools.wraps(handler)
+        def enqueue(**kwargs):
+            self.worker_pool.submit(event_type, kwargs)
+        
+        # Los mensajes se registran como evento con los mismos subtipos que filtra
+        # app.message(), sin su matcher de palabra clave (una regex por mensaje)
+        self.app.event(_MESSAGE_EVENT if event_type == "message" else event_type)(enqueue)
+        logger.debug("Manejador para evento %s registrado", event_type)
         
         # Guardar referencia al manejador
         self.event_handlers[event_type] = handler
@@ -129,12 +384,20 @@ class BoltConnector(SlackConnector):
         Returns:
             Dict[str, Any]: Información del canal.
         """
+        with self._cache_lock:
+            cached = self._channel_cache.get(channel_id)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.app.client.conversations_info(channel=channel_id)
-            return response
         except Exception as e:
-            logger.error(f"Error al obtener información del canal {channel_id}: {e}", exc_info=True)
-            return {"ok": False, "error": str(e)}
+            return _api_error(e, "Error al obtener información del canal %s", channel_id)
+        
+        if response.get("ok"):
+            with self._cache_lock:
+                self._channel_cache[channel_id] = response
+        return response
     
     def get_user_info(self, user_id: str) -> Dict[str, Any]:
         """
@@ -146,12 +409,79 @@ class BoltConnector(SlackConnector):
         Returns:
             Dict[str, Any]: Información del usuario.
         """
+        with self._cache_lock:
+            cached = self._user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.app.client.users_info(user=user_id)
-            return response
         except Exception as e:
-            logger.error(f"Error al obtener información del usuario {user_id}: {e}", exc_info=True)
-            return {"ok": False, "error": str(e)}
+            return _api_error(e, "Error al obtener información del usuario %s", user_id)
+        
+        if response.get("ok"):
+            with self._cache_lock:
+                self._user_cache[user_id] = response
+        return response
+    
+    def warm_channel_cache(self, channel_ids: Iterable[str]) -> None:
+        """
+        Precarga en la caché la información de los canales más usados, de modo que
+        sus primeras consultas no esperen a la API de Slack.
+        
+        Args:
+            channel_ids (Iterable[str]): IDs de los canales a precargar.
+        """
+        channel_ids = list(channel_ids)
+        if not channel_ids:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(channel_ids), BULK_SEND_MAX_WORKERS)) as executor:
+            executor.map(self.get_channel_info, channel_ids)
+        
+        logger.debug("Caché precargada con %d canales", len(channel_ids))
+    
+    def invalidate_channel(self, channel_id: str) -> None:
+        """
+        Descarta la información cacheada de un canal (p. ej. tras channel_rename).
+        
+        Args:
+            channel_id (str): ID del canal.
+        """
+        with self._cache_lock:
+            self._channel_cache.pop(channel_id, None)
+    
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Descarta la información cacheada de un usuario (p. ej. tras user_change).
+        
+        Args:
+            user_id (str): ID del usuario.
+        """
+        with self._cache_lock:
+            self._user_cache.pop(user_id, None)
+    
+    def _on_channel_rename(self, event: Dict[str, Any]) -> None:
+        """
+        Listener de channel_rename/group_rename: invalida el canal renombrado.
+        
+        Args:
+            event (Dict[str, Any]): Evento de Slack.
+        """
+        channel_id = (event.get("channel") or {}).get("id")
+        if channel_id:
+            self.invalidate_channel(channel_id)
+    
+    def _on_user_change(self, event: Dict[str, Any]) -> None:
+        """
+        Listener de user_change: invalida el usuario modificado.
+        
+        Args:
+            event (Dict[str, Any]): Evento de Slack.
+        """
+        user_id = (event.get("user") or {}).get("id")
+        if user_id:
+            self.invalidate_user(user_id)
 
 
 class DefaultEventHandler(EventHandler):
@@ -159,6 +489,8 @@ class DefaultEventHandler(EventHandler):
     Implementación por defecto del manejador de eventos.
     """
     
+    __slots__ = ('connector', 'personality_manager', 'context_manager', 'groq_client', '_template_cache')
+    
     def __init__(self, connector: SlackConnector, personality_manager=None, context_manager=None):
         """
         Inicializa el manejador de eventos.
@@ -172,8 +504,11 @@ class DefaultEventHandler(EventHandler):
         self.personality_manager = personality_manager
         self.context_manager = context_manager
         
-        # Inicializar cliente de Groq
-        self.groq_client = groq.Client(api_key=settings.GROQ_API_KEY)
+        # Cliente de Groq compartido (reutiliza conexiones TLS entre manejadores)
+        self.groq_client = _get_groq_client()
+        
+        # (personalidad, plantilla, tiene_campos) de la última plantilla resuelta
+        self._template_cache = None
         
         logger.debug("DefaultEventHandler inicializado")
     
@@ -187,35 +522,69 @@ class DefaultEventHandler(EventHandler):
         Returns:
             Optional[str]: Respuesta al mensaje, si corresponde.
         """
-        logger.info(f"Mensaje recibido: {message}")
+        get = message.get
         
-        # Ignorar mensajes del propio bot
-        if message.get("bot_id"):
-            logger.info(f"Ignorando mensaje del bot: {message.get('bot_id')}")
+        # Ignorar mensajes de bots (incluidos los ecos del propio bot) y ediciones/borrados
+        # antes de hacer cualquier otro trabajo
+        if get("bot_id") or get("subtype") in _IGNORED_SUBTYPES:
             return None
         
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mensaje recibido: %s", message)
+        
         # Extraer texto del mensaje
-        text = message.get("text", "")
-        user_id = message.get("user")
-        channel_id = message.get("channel")
+        text = get("text", "")
+        user_id = get("user")
+        channel_id = get("channel")
         
-        logger.info(f"Procesando mensaje: '{text}' de usuario {user_id} en canal {channel_id}")
+        logger.info("Procesando mensaje: '%s' de usuario %s en canal %s", text, user_id, channel_id)
         
         # Generar respuesta usando la personalidad
         try:
-            # Obtener plantilla de respuesta genérica
-            response_template = self.personality_manager.get_template("technical_explanation")
-            
-            # Formatear la respuesta con el contexto del mensaje
-            response = response_template.format(mensaje=text)
+            # Obtener plantilla de respuesta genérica y formatearla con el mensaje;
+            # las plantillas sin campos se envían tal cual
+            response_template, has_fields = self._get_message_template()
+            response = response_template.format(mensaje=text) if has_fields else response_template
             
             # Enviar respuesta al canal
-            self.connector.send_message(channel=channel_id, text=response)
+            self.connector.post_message(channel=channel_id, text=response)
             
             return response
         except Exception as e:
-            logger.error(f"Error al generar respuesta de personalidad: {e}", exc_info=True)
-            return f"Recibí tu mensaje: '{text}'"
+            logger.error("Error al generar respuesta de personalidad: %s", e, exc_info=True)
+            return _RECEIVED_TMPL % text
+    
+    def _get_message_template(self) -> Tuple[str, bool]:
+        """
+        Devuelve la plantilla de respuesta a mensajes de la personalidad activa.
+        
+        La plantilla se resuelve una vez y solo se vuelve a pedir al gestor de
+        personalidad si cambia la personalidad activa.
+        
+        Returns:
+            Tuple[str, bool]: Plantilla y si contiene campos a formatear.
+        """
+        active = self.personality_manager.active_personality
+        cache = self._template_cache
+        if cache is None or cache[0] != active:
+            template = self.personality_manager.get_template("technical_explanation")
+            cache = self._template_cache = (active, template, "{" in template)
+        return cache[1], cache[2]
+    
+    def _get_system_message(self) -> Dict[str, str]:
+        """
+        Devuelve el mensaje de sistema de la personalidad activa.
+        
+        Si no hay gestor de personalidad o la personalidad no define prompt, se usa
+        el de Lucius.
+        
+        Returns:
+            Dict[str, str]: Mensaje {"role": "system", "content": ...}; compartido, no modificarlo.
+        """
+        if self.personality_manager is None:
+            return _LUCIUS_SYSTEM_MSG
+        system_message = self.personality_manager.get_system_message()
+        return system_message if system_message["content"] else _LUCIUS_SYSTEM_MSG
     
     def handle_mention(self, body: Dict[str, Any]) -> Optional[str]:
         """
@@ -227,104 +596,163 @@ class DefaultEventHandler(EventHandler):
         Returns:
             Optional[str]: Respuesta a la mención, si corresponde.
         """
-        logger.info(f"Evento de mención recibido: {body}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Evento de mención recibido: %s", body)
         
         # Verificar si el evento tiene la estructura esperada
         if not body or 'event' not in body:
             logger.warning("Evento de mención no válido")
-            return "Lo siento, no pude procesar tu mensaje correctamente."
+            return _ERR_INVALID_MENTION
         
         # Extraer datos del evento
         event = body['event']
-        text = event.get("text", "")
-        user_id = event.get("user")
-        channel_id = event.get("channel")
+        get = event.get
+        text = get("text", "")
+        user_id = get("user")
+        channel_id = get("channel")
+        thread_ts = get("ts")
         
         # Eliminar la mención del bot del texto
-        bot_mention_pattern = r'<@[A-Z0-9]+>'
-        text_without_mention = re.sub(bot_mention_pattern, '', text).strip()
+        text_without_mention = _BOT_MENTION_RE.sub('', text).strip()
+        
+        logger.info("Procesando mención: '%s' de usuario %s en canal %s", text_without_mention, user_id, channel_id)
+        
+        send = self.connector.post_message
         
-        logger.info(f"Procesando mención: '{text_without_mention}' de usuario {user_id} en canal {channel_id}")
+        # Menciones vacías o triviales: respuesta fija sin llamar a Groq
+        canned = (
+            _MENTION_GREETING if len(text_without_mention) < 3
+            else _CANNED_MENTION_REPLIES.get(text_without_mention.lower().rstrip("!.?"))
+        )
+        if canned:
+            send(channel=channel_id, text=canned, thread_ts=thread_ts)
+            return canned
+        
+        # Groq falló repetidamente hace poco: respaldo inmediato, sin esperar su timeout
+        if _GROQ_BREAKER.is_open:
+            logger.warning("Circuito de Groq abierto; se envía la respuesta de respaldo")
+            fallback_response = _FALLBACK_TMPL % text_without_mention
+            send(channel=channel_id, text=fallback_response, thread_ts=thread_ts)
+            return fallback_response
         
         # Generar respuesta usando Groq LLM
+        placeholder = None
         try:
             # Obtener historial de conversación
             conversation_history = []
             if self.context_manager:
                 conversation_history, _ = self.context_manager.get_formatted_history(user_id, channel_id)
             
-            # Definir el prompt del sistema para Lucius
-            system_prompt = """
-            Eres Lucius Fox, un genio tecnológico y asesor confiable.
-
-            Tus objetivos son:
-            1. Proporcionar soluciones innovadoras y prácticas
-            2. Ofrecer asesoramiento honesto y directo, incluso cuando no es lo que quieren oír
-            3. Mantener un equilibrio entre brillantez técnica y accesibilidad
-            4. Preservar la ética profesional en todas las interacciones, aunque tu humor y sarcasmo te hace adorable
-
-            Características clave:
-            - Extraordinariamente inteligente
-            - Honesto y directo, con integridad inquebrantable
-            - Easygoing pero firme en sus convicciones
-            - Diligente y dedicado en cada proyecto
-            - Perspicaz, capaz de ver más allá de lo obvio
-            - Ingenioso con un humor sutil e inteligente, incluso sarcastico en el momento preciso, no siempre
-
-            Estilo de comunicación:
-            - Explicaciones técnicas precisas pero accesibles
-            - Comentarios ocasionales con humor seco e inteligente
-            - Respuestas tranquilas incluso en situaciones de presión
-            - Prefiere mostrar en lugar de sólo decir
-            """
-            
-            # Crear mensajes para la API de Groq
-            messages = [
-                {"role": "system", "content": system_prompt}
-            ]
-            
-            # Añadir historial de conversación si existe
-            if conversation_history:
-                messages.extend(conversation_history)
-            
-            # Añadir el mensaje actual del usuario
-            messages.append({"role": "user", "content": text_without_mention})
-            
-            # Llamar a la API de Groq
-            logger.info(f"Enviando solicitud a Groq con {len(messages)} mensajes")
-            completion = self.groq_client.chat.completions.create(
-                model=settings.GROQ_MODEL,
-                messages=messages,
-                max_tokens=settings.GROQ_MAX_TOKENS,
-                temperature=0.7,
-            )
-            
-            # Extraer la respuesta
-            response = completion.choices[0].message.content
-            
-            # Guardar la conversación en el contexto
-            if self.context_manager:
-                self.context_manager.add_message(user_id, channel_id, text_without_mention, is_bot=False)
-                self.context_manager.add_message(user_id, channel_id, response, is_bot=True)
+            # Crear mensajes para la API de Groq: sistema, historial y mensaje actual
+            messages = [self._get_system_message(), *conversation_history, {"role": "user", "content": text_without_mention}]
             
-            # Enviar respuesta al canal
-            self.connector.send_message(
-                channel=channel_id, 
-                text=response,
+            # Publicar un mensaje provisional, sin esperarlo, y editarlo a medida que
+            # llega la respuesta
+            placeholder = send(
+                channel=channel_id,
+                text=STREAM_PLACEHOLDER_TEXT,
                 # Añadir un thread_ts para hilar la conversación
-                thread_ts=event.get('ts')
+                thread_ts=thread_ts
             )
             
-            return response
+            logger.info("Enviando solicitud a Groq con %d mensajes", len(messages))
+            response = _GROQ_BREAKER.call(self._stream_completion, messages, channel_id, placeholder)
+            
+            # Enviar la respuesta completa (reemplazando el mensaje provisional si existe)
+            self._publish(channel_id, placeholder, response, thread_ts)
         except Exception as e:
-            logger.error(f"Error al generar respuesta con Groq: {e}", exc_info=True)
+            logger.error("Error al generar respuesta con Groq: %s", e, exc_info=True)
             # Respuesta de fallback en caso de error
-            fallback_response = f"Parece que hay un problema técnico en mi sistema. Estoy trabajando para resolverlo lo antes posible. Tu consulta sobre '{text_without_mention}' es importante y la atenderé en cuanto solucione este inconveniente."
+            fallback_response = _FALLBACK_TMPL % text_without_mention
             
-            self.connector.send_message(
-                channel=channel_id,
-                text=fallback_response,
-                thread_ts=event.get('ts')
-            )
+            self._publish(channel_id, placeholder, fallback_response, thread_ts)
             
             return fallback_response
+        
+        # Guardar la conversación en el contexto una vez enviada la respuesta, fuera
+        # del camino que ve el usuario
+        if self.context_manager:
+            self.context_manager.add_messages(
+                user_id, channel_id, [(text_without_mention, False), (response, True)]
+            )
+        
+        return response
+    
+    def _stream_completion(self, messages: List[Dict[str, str]], channel_id: str,
+                           placeholder: Optional[Future]) -> str:
+        """
+        Pide la respuesta a Groq en streaming y va editando el mensaje provisional.
+        
+        Las ediciones se agrupan cada STREAM_UPDATE_INTERVAL segundos para no
+        exceder el rate limit de chat.update, y solo empiezan cuando el mensaje
+        provisional ya se ha enviado.
+        
+        Args:
+            messages (List[Dict[str, str]]): Mensajes para la API de Groq.
+            channel_id (str): ID del canal.
+            placeholder (Optional[Future]): Envío del mensaje provisional; si es None no se edita nada.
+            
+        Returns:
+            str: Respuesta completa del modelo.
+        """
+        stream = self.groq_client.chat.completions.create(
+            model=settings.GROQ_MODEL,
+            messages=messages,
+            max_tokens=settings.GROQ_MAX_TOKENS,
+            temperature=0.7,
+            n=1,
+            stream=True,
+            timeout=GROQ_TIMEOUT,
+        )
+        
+        # Enlaces locales: el bucle corre una vez por chunk del stream
+        parts = []
+        append = parts.append
+        monotonic = time.monotonic
+        update_message = self.connector.update_message
+        placeholder_ts = None
+        next_update = monotonic() + STREAM_UPDATE_INTERVAL
+        for chunk in stream:
+            choices = chunk.choices
+            if not choices:
+                continue
+            delta = choices[0].delta.content
+            if not delta:
+                continue
+            append(delta)
+            
+            if monotonic() >= next_update:
+                if placeholder_ts is None and placeholder is not None and placeholder.done():
+                    placeholder_ts = _message_ts(placeholder.result())
+                    placeholder = None
+                if placeholder_ts:
+                    update_message(channel=channel_id, ts=placeholder_ts, text="".join(parts))
+                next_update = monotonic() + STREAM_UPDATE_INTERVAL
+        
+        return "".join(parts)
+    
+    def _publish(self, channel_id: str, placeholder: Optional[Future], text: str,
+                 thread_ts: Optional[str]) -> None:
+        """
+        Publica el texto final: edita el mensaje provisional o, si no existe, envía uno nuevo.
+        
+        Si el mensaje provisional aún no se ha enviado, la edición se hace cuando se
+        envíe, sin bloquear el hilo actual.
+        
+        Args:
+            channel_id (str): ID del canal.
+            placeholder (Optional[Future]): Envío del mensaje provisional.
+            text (str): Texto a publicar.
+            thread_ts (Optional[str]): Hilo en el que responder si se envía un mensaje nuevo.
+        """
+        connector = self.connector
+        
+        def publish(placeholder_ts: Optional[str]) -> None:
+            if placeholder_ts and connector.update_message(channel=channel_id, ts=placeholder_ts, text=text).get("ok"):
+                return
+            connector.post_message(channel=channel_id, text=text, thread_ts=thread_ts)
+        
+        if placeholder is None:
+            publish(None)
+        else:
+            placeholder.add_done_callback(lambda future: publish(_message_ts(future.result())))
@@ -0,0 +1,178 @@
+"""
+Pool de workers compartido para procesar eventos de Slack fuera del listener.
+"""
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Deque, Optional, Tuple
+
+from slack_bot.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _event_key(kwargs: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Obtiene la clave (team_id, user_id) de un evento encolado.
+    
+    Args:
+        kwargs (Dict[str, Any]): Argumentos que Bolt pasó al listener.
+    
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Equipo y usuario que originaron el evento.
+    """
+    body = kwargs.get("body") or {}
+    event = kwargs.get("message") or kwargs.get("event") or body.get("event") or {}
+    team_id = body.get("team_id") or event.get("team")
+    return team_id, event.get("user")
+
+
+class WorkerPool:
+    """
+    Pool de workers que consume una única cola acotada de eventos.
+    
+    Todos los tipos de evento comparten la misma cola; el despachador reparte cada
+    evento en una cola serie por (team_id, user_id), que un worker drena en orden.
+    Los eventos de un mismo usuario se procesan secuencialmente y los de usuarios
+    distintos en paralelo, sin que un evento lento bloquee a los demás. Cuando hay
+    queue_size eventos en curso la cola deja de vaciarse y submit() bloquea al
+    productor (backpressure).
+    """
+    
+    __slots__ = (
+        'num_workers', 'queue', 'handlers', '_pending', '_pending_lock', '_in_flight',
+        '_dispatcher', '_executor'
+    )
+    
+    def __init__(self, num_workers: Optional[int] = None, queue_size: Optional[int] = None):
+        """
+        Inicializa el pool de workers.
+        
+        Args:
+            num_workers (Optional[int]): Máximo de usuarios procesados en paralelo. Si es None, se usa el de settings.
+            queue_size (Optional[int]): Capacidad de la cola. Si es None, se usa la de settings.
+        """
+        queue_size = queue_size or settings.EVENT_QUEUE_SIZE
+        self.num_workers = num_workers or settings.INGESTION_CONCURRENCY
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.handlers: Dict[str, Callable] = {}
+        # Eventos pendientes por clave; una clave presente tiene un worker drenándola
+        self._pending: Dict[Tuple[Optional[str], Optional[str]], Deque[Tuple[str, Dict[str, Any]]]] = {}
+        self._pending_lock = threading.Lock()
+        # Limita los eventos sacados de la cola y aún sin terminar
+        self._in_flight = threading.BoundedSemaphore(queue_size)
+        self._dispatcher = None
+        self._executor = None
+    
+    def register(self, event_type: str, handler: Callable) -> None:
+        """
+        Registra el manejador de un tipo de evento.
+        
+        Args:
+            event_type (str): Tipo de evento.
+            handler (Callable): Función que procesa el evento.
+        """
+        self.handlers[event_type] = handler
+    
+    def submit(self, event_type: str, kwargs: Dict[str, Any]) -> None:
+        """
+        Encola un evento para su procesamiento.
+        
+        Args:
+            event_type (str): Tipo de evento.
+            kwargs (Dict[str, Any]): Argumentos con los que se invocará al manejador.
+        """
+        self.queue.put((event_type, kwargs))
+    
+    def start(self) -> None:
+        """
+        Inicia el hilo despachador y el pool que procesa los eventos.
+        """
+        if self._dispatcher:
+            return
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_workers,
+            thread_name_prefix="slack-event-worker"
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="slack-event-dispatcher", daemon=True)
+        self._dispatcher.start()
+        
+        logger.debug(f"Pool de workers iniciado (concurrencia: {self.num_workers})")
+    
+    def stop(self) -> None:
+        """
+        Detiene el despachador enviando un centinela y cierra el pool.
+        
+        Se espera a que el despachador termine antes de cerrar el pool, para que no
+        intente enviarle trabajo una vez cerrado.
+        """
+        if not self._dispatcher:
+            return
+        
+        self.queue.put(None)
+        self._dispatcher.join()
+        self._dispatcher = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _dispatch_loop(self) -> None:
+        """
+        Reparte los eventos de la cola en las colas serie de cada usuario.
+        """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            
+            self._in_flight.acquire()
+            key = _event_key(item[1])
+            with self._pending_lock:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    # Ya hay un worker drenando esta clave; lo procesará en orden
+                    pending.append(item)
+                    continue
+                self._pending[key] = deque((item,))
+            
+            self._executor.submit(self._drain_key, key)
+    
+    def _drain_key(self, key: Tuple[Optional[str], Optional[str]]) -> None:
+        """
+        Ejecuta en orden los eventos pendientes de un mismo usuario hasta vaciar su cola.
+        
+        Args:
+            key (Tuple[Optional[str], Optional[str]]): Clave (team_id, user_id) a drenar.
+        """
+        while True:
+            with self._pending_lock:
+                pending = self._pending[key]
+                if not pending:
+                    del self._pending[key]
+                    return
+                event_type, kwargs = pending.popleft()
+            
+            try:
+                self._run_handler(event_type, kwargs)
+            finally:
+                self._in_flight.release()
+    
+    def _run_handler(self, event_type: str, kwargs: Dict[str, Any]) -> None:
+        """
+        Invoca el manejador registrado para un evento, registrando sus errores.
+        
+        Args:
+            event_type (str): Tipo de evento.
+            kwargs (Dict[str, Any]): Argumentos con los que se invocará al manejador.
+        """
+        handler = self.handlers.get(event_type)
+        if handler is None:
+            logger.warning(f"No hay manejador registrado para el evento {event_type}")
+            return
+        try:
+            handler(**kwargs)
+        except Exception as e:
+            logger.error(f"Error al procesar evento {event_type}: {e}", exc_info=True)
@@ -2,30 +2,80 @@
 Implementación de historial de conversación.
 """
 import logging
+import sys
 import time
+from collections import OrderedDict, deque
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Roles de mensaje admitidos en el historial
+_VALID_ROLES = frozenset({"user", "assistant", "system"})
+
+# Rol admitido -> su cadena internada; valida e interna con una sola búsqueda
+_INTERNED_ROLES = {role: sys.intern(role) for role in _VALID_ROLES}
+
 
 class ConversationHistory:
     """
     Clase para gestionar el historial de una conversación.
+    
+    Los mensajes se guardan por columnas (roles, contenidos y timestamps en deques
+    paralelas) en lugar de un diccionario por mensaje; los diccionarios solo se
+    construyen al consultarlos.
     """
     
-    def __init__(self, conversation_id: str):
+    __slots__ = ('conversation_id', 'max_messages', 'max_bytes', 'created_at', 'last_updated',
+                 '_roles', '_contents', '_timestamps', '_role_counts', '_total_bytes')
+    
+    def __init__(self, conversation_id: str, max_messages: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
         """
         Inicializa el historial de conversación.
         
         Args:
             conversation_id (str): ID único de la conversación.
+            max_messages (Optional[int]): Número máximo de mensajes a conservar; los más
+                antiguos se descartan en O(1). Si es None, el historial no tiene límite.
+            max_bytes (Optional[int]): Tamaño máximo (en bytes UTF-8) del contenido de todos
+                los mensajes; al superarlo se descartan los más antiguos, conservando siempre
+                el último. Si es None, no se limita el tamaño.
+        
+        Raises:
+            ValueError: Si max_messages es menor que 1.
         """
+        if max_messages is not None and max_messages < 1:
+            raise ValueError(f"max_messages debe ser al menos 1, no {max_messages}")
+        
         self.conversation_id = conversation_id
-        self.messages = []
-        self.created_at = time.time()
-        self.last_updated = time.time()
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        # Columnas paralelas: el mensaje i es (_roles[i], _contents[i], _timestamps[i])
+        self._roles: deque = deque(maxlen=max_messages)
+        self._contents: deque = deque(maxlen=max_messages)
+        self._timestamps: deque = deque(maxlen=max_messages)
+        self.created_at = self.last_updated = time.time()
+        # Mensajes por rol, mantenidos al añadir/descartar para que get_summary sea O(1)
+        self._role_counts: Dict[str, int] = dict.fromkeys(_VALID_ROLES, 0)
+        # Tamaño del contenido retenido; solo se mantiene si hay límite de bytes
+        self._total_bytes = 0
         
-        logger.debug(f"ConversationHistory inicializado para conversación {conversation_id}")
+        logger.debug("ConversationHistory inicializado para conversación %s", conversation_id)
+    
+    @property
+    def messages(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Mensajes del historial como diccionarios (construidos en cada acceso).
+        
+        Es una copia de solo lectura: para modificar el historial se usan add_message
+        y clear, así que intentar hacer append/clear sobre ella falla en lugar de no
+        tener efecto.
+        
+        Returns:
+            Tuple[Dict[str, Any], ...]: Mensajes, del más antiguo al más reciente.
+        """
+        return tuple(self._build_messages(0))
     
     def add_message(self, role: str, content: str) -> None:
         """
@@ -35,21 +85,76 @@ class ConversationHistory:
             role (str): Rol del mensaje ('user' o 'assistant').
             content (str): Contenido del mensaje.
         """
-        if role not in ['user', 'assistant', 'system']:
-            logger.warning(f"Rol de mensaje no válido: {role}, se usará 'user'")
-            role = 'user'
+        interned_role = _INTERNED_ROLES.get(role)
+        if interned_role is None:
+            logger.warning("Rol de mensaje no válido: %s, se usará 'user'", role)
+            interned_role = _INTERNED_ROLES['user']
         
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": time.time()
-        }
+        roles = self._roles
+        contents = self._contents
+        if len(roles) == roles.maxlen:
+            # Las deques van a descartar el mensaje más antiguo al añadir este
+            self._on_evict(roles[0], contents[0])
         
-        self.messages.append(message)
-        self.last_updated = time.time()
+        now = time.time()
+        roles.append(interned_role)
+        contents.append(content)
+        self._timestamps.append(now)
+        self._role_counts[interned_role] += 1
+        self.last_updated = now
+        
+        if self.max_bytes is not None:
+            self._total_bytes += len(content.encode('utf-8'))
+            self._trim_to_max_bytes()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mensaje añadido a conversación %s, total: %d",
+                         self.conversation_id, len(roles))
+    
+    def _trim_to_max_bytes(self) -> None:
+        """
+        Descarta los mensajes más antiguos hasta respetar max_bytes (conserva el último).
+        """
+        roles = self._roles
+        contents = self._contents
+        timestamps = self._timestamps
+        while self._total_bytes > self.max_bytes and len(roles) > 1:
+            timestamps.popleft()
+            self._on_evict(roles.popleft(), contents.popleft())
+    
+    def _on_evict(self, role: str, content: str) -> None:
+        """
+        Actualiza los contadores incrementales al descartar un mensaje.
+        
+        Args:
+            role (str): Rol del mensaje descartado.
+            content (str): Contenido del mensaje descartado.
+        """
+        self._role_counts[role] = self._role_counts.get(role, 0) - 1
+        if self.max_bytes is not None:
+            self._total_bytes -= len(content.encode('utf-8'))
+    
+    def _build_messages(self, start: int, include_timestamps: bool = True) -> List[Dict[str, Any]]:
+        """
+        Construye los diccionarios de los mensajes a partir de la posición start.
+        
+        Args:
+            start (int): Índice del primer mensaje a incluir.
+            include_timestamps (bool): Si se deben incluir los timestamps.
+            
+        Returns:
+            List[Dict[str, Any]]: Lista de mensajes.
+        """
+        roles = islice(self._roles, start, None)
+        contents = islice(self._contents, start, None)
+        if not include_timestamps:
+            return [{"role": role, "content": content} for role, content in zip(roles, contents)]
         
-        logger.debug(f"Mensaje añadido a conversación {self.conversation_id}, "
-                    f"total: {len(self.messages)}")
+        timestamps = islice(self._timestamps, start, None)
+        return [
+            {"role": role, "content": content, "timestamp": timestamp}
+            for role, content, timestamp in zip(roles, contents, timestamps)
+        ]
     
     def get_messages(self, max_messages: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -63,9 +168,9 @@ class ConversationHistory:
             List[Dict[str, Any]]: Lista de mensajes.
         """
         if max_messages is None:
-            return self.messages
+            return self._build_messages(0)
         
-        return self.messages[-max_messages:]
+        return self._build_messages(max(len(self._roles) - max_messages, 0))
     
     def get_formatted_messages(self, include_timestamps: bool = False) -> List[Dict[str, str]]:
         """
@@ -77,11 +182,8 @@ class ConversationHistory:
         Returns:
             List[Dict[str, str]]: Lista de mensajes formateados.
         """
-        if include_timestamps:
-            return self.messages
-        
-        # Formatear para API (solo role y content)
-        return [{"role": msg["role"], "content": msg["content"]} for msg in self.messages]
+        # Formatear para API (solo role y content, salvo que se pidan los timestamps)
+        return self._build_messages(0, include_timestamps)
     
     def get_last_message(self) -> Optional[Dict[str, Any]]:
         """
@@ -90,18 +192,22 @@ class ConversationHistory:
         Returns:
             Optional[Dict[str, Any]]: Último mensaje, o None si no hay mensajes.
         """
-        if not self.messages:
+        if not self._roles:
             return None
         
-        return self.messages[-1]
+        return {"role": self._roles[-1], "content": self._contents[-1], "timestamp": self._timestamps[-1]}
     
     def clear(self) -> None:
         """
         Limpia el historial de mensajes.
         """
-        self.messages = []
+        self._roles.clear()
+        self._contents.clear()
+        self._timestamps.clear()
+        self._role_counts = dict.fromkeys(_VALID_ROLES, 0)
+        self._total_bytes = 0
         self.last_updated = time.time()
-        logger.debug(f"Historial de conversación {self.conversation_id} limpiado")
+        logger.debug("Historial de conversación %s limpiado", self.conversation_id)
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -112,12 +218,12 @@ class ConversationHistory:
         """
         return {
             "conversation_id": self.conversation_id,
-            "message_count": len(self.messages),
+            "message_count": len(self._roles),
             "created_at": self.created_at,
             "last_updated": self.last_updated,
             "duration": self.last_updated - self.created_at,
-            "user_messages": sum(1 for msg in self.messages if msg["role"] == "user"),
-            "assistant_messages": sum(1 for msg in self.messages if msg["role"] == "assistant"),
+            "user_messages": self._role_counts["user"],
+            "assistant_messages": self._role_counts["assistant"],
         }
     
     def to_dict(self) -> Dict[str, Any]:
@@ -129,7 +235,9 @@ class ConversationHistory:
         """
         return {
             "conversation_id": self.conversation_id,
-            "messages": self.messages,
+            "max_messages": self.max_messages,
+            "max_bytes": self.max_bytes,
+            "messages": self._build_messages(0),
             "created_at": self.created_at,
             "last_updated": self.last_updated,
         }
@@ -145,8 +253,23 @@ class ConversationHistory:
         Returns:
             ConversationHistory: Historial creado.
         """
-        history = cls(data["conversation_id"])
-        history.messages = data["messages"]
+        history = cls(data["conversation_id"], data.get("max_messages"), data.get("max_bytes"))
+        
+        # Repartir los mensajes en las columnas (maxlen conserva solo los más recientes)
+        messages = data["messages"]
+        history._roles.extend(sys.intern(msg["role"]) for msg in messages)
+        history._contents.extend(msg["content"] for msg in messages)
+        history._timestamps.extend(msg["timestamp"] for msg in messages)
+        
+        # Recalcular los contadores una sola vez
+        role_counts = history._role_counts
+        for role in history._roles:
+            role_counts[role] = role_counts.get(role, 0) + 1
+        
+        if history.max_bytes is not None:
+            history._total_bytes = sum(len(content.encode('utf-8')) for content in history._contents)
+            history._trim_to_max_bytes()
+        
         history.created_at = data["created_at"]
         history.last_updated = data["last_updated"]
         
@@ -166,9 +289,10 @@ class ConversationHistoryManager:
             max_conversations (int): Número máximo de conversaciones a mantener.
         """
         self.max_conversations = max_conversations
-        self.histories = {}  # Diccionario de historiales por ID de conversación
+        # Historiales por ID de conversación, del menos al más recientemente usado
+        self.histories: "OrderedDict[str, ConversationHistory]" = OrderedDict()
         
-        logger.debug(f"ConversationHistoryManager inicializado con max_conversations={max_conversations}")
+        logger.debug("ConversationHistoryManager inicializado con max_conversations=%d", max_conversations)
     
     def get_history(self, conversation_id: str) -> ConversationHistory:
         """
@@ -180,14 +304,19 @@ class ConversationHistoryManager:
         Returns:
             ConversationHistory: Historial de la conversación.
         """
-        if conversation_id not in self.histories:
-            self.histories[conversation_id] = ConversationHistory(conversation_id)
-            
-            # Limitar número de conversaciones
-            if len(self.histories) > self.max_conversations:
-                self._cleanup_oldest()
+        history = self.histories.get(conversation_id)
+        if history is not None:
+            # Marcar como la más recientemente usada
+            self.histories.move_to_end(conversation_id)
+            return history
+        
+        history = self.histories[conversation_id] = ConversationHistory(conversation_id)
+        
+        # Limitar número de conversaciones
+        if len(self.histories) > self.max_conversations:
+            self._cleanup_oldest()
         
-        return self.histories[conversation_id]
+        return history
     
     def add_message(self, conversation_id: str, role: str, content: str) -> None:
         """
@@ -210,7 +339,7 @@ class ConversationHistoryManager:
         """
         if conversation_id in self.histories:
             self.histories[conversation_id].clear()
-            logger.debug(f"Historial de conversación {conversation_id} limpiado")
+            logger.debug("Historial de conversación %s limpiado", conversation_id)
     
     def delete_history(self, conversation_id: str) -> None:
         """
@@ -221,24 +350,17 @@ class ConversationHistoryManager:
         """
         if conversation_id in self.histories:
             del self.histories[conversation_id]
-            logger.debug(f"Historial de conversación {conversation_id} eliminado")
+            logger.debug("Historial de conversación %s eliminado", conversation_id)
     
     def _cleanup_oldest(self) -> None:
         """
-        Elimina la conversación más antigua.
+        Elimina la conversación usada hace más tiempo (la primera del OrderedDict).
         """
         if not self.histories:
             return
         
-        # Encontrar la conversación más antigua
-        oldest_id = min(
-            self.histories.keys(),
-            key=lambda k: self.histories[k].last_updated
-        )
-        
-        # Eliminar la conversación más antigua
-        del self.histories[oldest_id]
-        logger.debug(f"Historial de conversación más antiguo ({oldest_id}) eliminado")
+        oldest_id, _ = self.histories.popitem(last=False)
+        logger.debug("Historial de conversación más antiguo (%s) eliminado", oldest_id)
     
     def get_all_conversation_ids(self) -> List[str]:
         """
@@ -289,7 +411,9 @@ class ConversationHistoryManager:
         """
         manager = cls(data["max_conversations"])
         
-        for conv_id, history_data in data["histories"].items():
+        # Reconstruir el orden LRU a partir de la última actualización de cada historial
+        histories = sorted(data["histories"].items(), key=lambda item: item[1]["last_updated"])
+        for conv_id, history_data in histories:
             manager.histories[conv_id] = ConversationHistory.from_dict(history_data)
         
         return manager
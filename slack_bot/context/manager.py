@@ -3,13 +3,37 @@ Gestor de contexto para mantener historial de conversaciones.
 """
 import logging
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from collections import deque
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 
 from slack_bot.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class _Conversation:
+    """
+    Estado de una conversación: sus mensajes y la última vez que se usó.
+    
+    last_updated se mide con time.monotonic(): solo sirve para calcular la expiración
+    y así no le afectan los saltos del reloj del sistema (NTP, cambios de hora).
+    """
+    
+    __slots__ = ('messages', 'last_updated')
+    
+    def __init__(self, max_messages: int, last_updated: float):
+        """
+        Inicializa una conversación vacía.
+        
+        Args:
+            max_messages (int): Número máximo de mensajes a mantener.
+            last_updated (float): Instante de creación según time.monotonic().
+        """
+        # maxlen descarta el mensaje más antiguo en O(1) al superar el límite
+        self.messages: deque = deque(maxlen=max_messages)
+        self.last_updated = last_updated
+
+
 class ContextManager:
     """
     Gestor de contexto que mantiene el historial de conversaciones.
@@ -27,10 +51,11 @@ class ContextManager:
         """
         self.max_messages = max_messages or settings.MAX_CONTEXT_MESSAGES
         self.expiry_minutes = expiry_minutes or settings.CONTEXT_EXPIRY_MINUTES
-        self.conversations = {}  # Diccionario de conversaciones por ID de conversación
+        self._expiry_seconds = self.expiry_minutes * 60
+        self.conversations: Dict[str, _Conversation] = {}  # Conversaciones por ID de conversación
         
-        logger.debug(f"ContextManager inicializado con max_messages={self.max_messages}, "
-                    f"expiry_minutes={self.expiry_minutes}")
+        logger.debug("ContextManager inicializado con max_messages=%d, expiry_minutes=%d",
+                     self.max_messages, self.expiry_minutes)
     
     def _get_conversation_id(self, user_id: str, channel_id: str) -> str:
         """
@@ -56,30 +81,61 @@ class ContextManager:
             is_bot (bool, optional): Si el mensaje es del bot. Por defecto, False.
         """
         conversation_id = self._get_conversation_id(user_id, channel_id)
+        now = time.time()
+        last_used = time.monotonic()
         
         # Inicializar conversación si no existe
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = {
-                "messages": [],
-                "last_updated": time.time()
-            }
+        conversation = self.conversations.get(conversation_id)
+        if conversation is None:
+            conversation = self.conversations[conversation_id] = _Conversation(self.max_messages, last_used)
         
         # Añadir mensaje
-        self.conversations[conversation_id]["messages"].append({
+        history = conversation.messages
+        history.append({
             "role": "assistant" if is_bot else "user",
             "content": text,
-            "timestamp": time.time()
+            "timestamp": now
         })
         
         # Actualizar timestamp
-        self.conversations[conversation_id]["last_updated"] = time.time()
+        conversation.last_updated = last_used
         
-        # Limitar número de mensajes
-        if len(self.conversations[conversation_id]["messages"]) > self.max_messages:
-            self.conversations[conversation_id]["messages"].pop(0)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mensaje añadido a conversación %s, total: %d", conversation_id, len(history))
+    
+    def add_messages(self, user_id: str, channel_id: str, messages: List[Tuple[str, bool]]) -> None:
+        """
+        Añade varios mensajes de una vez al contexto de una conversación.
+        
+        Equivale a llamar a add_message por cada mensaje, pero resuelve la
+        conversación y el timestamp una sola vez.
+        
+        Args:
+            user_id (str): ID del usuario.
+            channel_id (str): ID del canal.
+            messages (List[Tuple[str, bool]]): Pares (texto, es_del_bot) en orden.
+        """
+        conversation_id = self._get_conversation_id(user_id, channel_id)
+        now = time.time()
+        last_used = time.monotonic()
         
-        logger.debug(f"Mensaje añadido a conversación {conversation_id}, "
-                    f"total: {len(self.conversations[conversation_id]['messages'])}")
+        # Inicializar conversación si no existe
+        conversation = self.conversations.get(conversation_id)
+        if conversation is None:
+            conversation = self.conversations[conversation_id] = _Conversation(self.max_messages, last_used)
+        
+        # Añadir mensajes
+        history = conversation.messages
+        history.extend(
+            {"role": "assistant" if is_bot else "user", "content": text, "timestamp": now}
+            for text, is_bot in messages
+        )
+        
+        # Actualizar timestamp
+        conversation.last_updated = last_used
+        
+        logger.debug("%d mensajes añadidos a conversación %s, total: %d",
+                     len(messages), conversation_id, len(history))
     
     def get_conversation_history(self, user_id: str, channel_id: str) -> List[Dict[str, Any]]:
         """
@@ -92,23 +148,35 @@ class ContextManager:
         Returns:
             List[Dict[str, Any]]: Lista de mensajes de la conversación.
         """
-        conversation_id = self._get_conversation_id(user_id, channel_id)
+        return list(self._get_active_messages(self._get_conversation_id(user_id, channel_id)))
+    
+    def _get_active_messages(self, conversation_id: str) -> Iterable[Dict[str, Any]]:
+        """
+        Obtiene los mensajes de una conversación vigente, sin copiarlos.
         
+        Args:
+            conversation_id (str): ID de la conversación.
+            
+        Returns:
+            Iterable[Dict[str, Any]]: Mensajes de la conversación (vacío si no existe o expiró).
+        """
         # Verificar si la conversación existe
-        if conversation_id not in self.conversations:
-            logger.debug(f"Conversación {conversation_id} no encontrada")
-            return []
+        conversation = self.conversations.get(conversation_id)
+        if conversation is None:
+            logger.debug("Conversación %s no encontrada", conversation_id)
+            return ()
         
         # Verificar si la conversación ha expirado
-        if self._has_expired(conversation_id):
-            logger.debug(f"Conversación {conversation_id} ha expirado")
+        now = time.monotonic()
+        if self._has_expired_by_data(conversation, now):
+            logger.debug("Conversación %s ha expirado", conversation_id)
             self._cleanup_conversation(conversation_id)
-            return []
+            return ()
         
         # Actualizar timestamp
-        self.conversations[conversation_id]["last_updated"] = time.time()
+        conversation.last_updated = now
         
-        return self.conversations[conversation_id]["messages"]
+        return conversation.messages
     
     def get_formatted_history(self, user_id: str, channel_id: str) -> Tuple[List[Dict[str, str]], str]:
         """
@@ -120,20 +188,25 @@ class ContextManager:
             
         Returns:
             Tuple[List[Dict[str, str]], str]: Tupla con la lista de mensajes formateados
-                para la API y un string con el historial formateado para debugging.
+                para la API y un string con el historial formateado para debugging (vacío
+                si el nivel DEBUG no está activo).
         """
-        history = self.get_conversation_history(user_id, channel_id)
+        history = self._get_active_messages(self._get_conversation_id(user_id, channel_id))
         
-        # Formatear para API (solo role y content)
-        api_messages = [{"role": msg["role"], "content": msg["content"]} for msg in history]
+        # Formatear para API (solo role y content) y, solo con DEBUG activo, para debugging,
+        # en una única pasada
+        if not logger.isEnabledFor(logging.DEBUG):
+            return [{"role": msg["role"], "content": msg["content"]} for msg in history], ""
         
-        # Formatear para debugging
-        debug_history = "\n".join([
-            f"[{msg['role']}]: {msg['content']}"
-            for msg in history
-        ])
+        api_messages = []
+        debug_parts = []
+        for msg in history:
+            role = msg["role"]
+            content = msg["content"]
+            api_messages.append({"role": role, "content": content})
+            debug_parts.append(f"[{role}]: {content}")
         
-        return api_messages, debug_history
+        return api_messages, "\n".join(debug_parts)
     
     def clear_conversation(self, user_id: str, channel_id: str) -> None:
         """
@@ -145,7 +218,7 @@ class ContextManager:
         """
         conversation_id = self._get_conversation_id(user_id, channel_id)
         self._cleanup_conversation(conversation_id)
-        logger.debug(f"Conversación {conversation_id} limpiada")
+        logger.debug("Conversación %s limpiada", conversation_id)
     
     def _cleanup_conversation(self, conversation_id: str) -> None:
         """
@@ -167,13 +240,24 @@ class ContextManager:
         Returns:
             bool: True si la conversación ha expirado, False en caso contrario.
         """
-        if conversation_id not in self.conversations:
+        conversation = self.conversations.get(conversation_id)
+        if conversation is None:
             return True
         
-        last_updated = self.conversations[conversation_id]["last_updated"]
-        expiry_time = last_updated + (self.expiry_minutes * 60)
+        return self._has_expired_by_data(conversation, time.monotonic())
+    
+    def _has_expired_by_data(self, conversation: _Conversation, now: float) -> bool:
+        """
+        Verifica si una conversación ya resuelta ha expirado.
         
-        return time.time() > expiry_time
+        Args:
+            conversation (_Conversation): Conversación a comprobar.
+            now (float): Instante actual según time.monotonic().
+            
+        Returns:
+            bool: True si la conversación ha expirado, False en caso contrario.
+        """
+        return now > conversation.last_updated + self._expiry_seconds
     
     def cleanup_expired(self) -> int:
         """
@@ -182,13 +266,15 @@ class ContextManager:
         Returns:
             int: Número de conversaciones limpiadas.
         """
-        expired_ids = [
-            conv_id for conv_id in self.conversations
-            if self._has_expired(conv_id)
-        ]
-        
-        for conv_id in expired_ids:
-            self._cleanup_conversation(conv_id)
+        # Reconstruir el diccionario con las vigentes en una sola pasada, sin borrados
+        now = time.monotonic()
+        has_expired = self._has_expired_by_data
+        before = len(self.conversations)
+        self.conversations = {
+            conv_id: conversation for conv_id, conversation in self.conversations.items()
+            if not has_expired(conversation, now)
+        }
         
-        logger.debug(f"Limpiadas {len(expired_ids)} conversaciones expiradas")
-        return len(expired_ids)
+        removed = before - len(self.conversations)
+        logger.debug("Limpiadas %d conversaciones expiradas", removed)
+        return removed
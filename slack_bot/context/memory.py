@@ -1,14 +1,49 @@
 """
 Implementación de almacenamiento en memoria modular y reutilizable.
 """
+import itertools
 import logging
+import os
+import queue
+import sqlite3
+import threading
 import time
+import weakref
 import json
 import abc
-from typing import Dict, List, Any, Optional, Type, Callable
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Type, Callable
+
+# Toda la persistencia pasa por _dumps/_loads (bytes): orjson si está instalado,
+# json estándar si no. Los errores de parseo de ambos son ValueError.
+try:
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps, loads as _loads
+    
+    def _dumps(data: Any, pretty: bool = False) -> bytes:
+        """Serializa data como JSON compacto, o indentado si pretty (orjson)"""
+        return _orjson_dumps(data, option=OPT_INDENT_2 if pretty else None)
+except ImportError:
+    from json import loads as _loads
+    
+    def _dumps(data: Any, pretty: bool = False) -> bytes:
+        """Serializa data como JSON compacto, o indentado si pretty (json estándar)"""
+        if pretty:
+            return json.dumps(data, indent=2).encode('utf-8')
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
 
 logger = logging.getLogger(__name__)
 
+# Máximo de mensajes que el hilo de persistencia escribe en una sola operación
+PERSIST_BATCH_SIZE = 64
+
+# Centinela que detiene el hilo de persistencia de un gestor
+_PERSIST_STOP = object()
+
+# Prefijo de la clave persistente según el tipo de mensaje
+_MESSAGE_KEY_PREFIXES = {"human": "user_message", "ai": "ai_message"}
+
+# Buffer de lectura al importar un almacén JSON anterior a la base SQLite
+READ_BUFFER_SIZE = 1 << 20
+
 class MemoryStore(abc.ABC):
     """
     Clase base abstracta para almacenamiento de memoria
@@ -19,6 +54,14 @@ class MemoryStore(abc.ABC):
         """Guarda un valor con una clave específica"""
         pass
 
+    def save_many(self, items: List[Tuple[str, Any]]):
+        """Guarda varios pares (clave, valor); por defecto, uno a uno"""
+        for key, value in items:
+            self.save(key, value)
+
+    def flush(self):
+        """Lleva al disco las escrituras pendientes; por defecto, no hace nada"""
+
     @abc.abstractmethod
     def load(self, key: str) -> Any:
         """Carga un valor por su clave"""
@@ -30,7 +73,7 @@ class MemoryStore(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_all_keys(self) -> List[str]:
+    def get_all_keys(self) -> Sequence[str]:
         """Obtiene todas las claves almacenadas"""
         pass
 
@@ -51,7 +94,8 @@ class MemoryStrategyRegistry:
         cls, 
         name: str, 
         memory_class: Optional[Type] = None, 
-        config_handler: Optional[Callable] = None
+        config_handler: Optional[Callable] = None,
+        requires_llm: bool = False
     ):
         """
         Registra una nueva estrategia de memoria
@@ -60,10 +104,13 @@ class MemoryStrategyRegistry:
             name: Nombre único de la estrategia
             memory_class: Clase de memoria (opcional)
             config_handler: Función opcional para manejar configuraciones personalizadas
+            requires_llm: Si la estrategia necesita un modelo de lenguaje (argumento llm);
+                si no, los llamadores pueden evitar construirlo
         """
         cls._strategies[name] = {
             'class': memory_class,
-            'config_handler': config_handler or (lambda **kwargs: {})
+            'config_handler': config_handler or (lambda **kwargs: {}),
+            'requires_llm': requires_llm
         }
 
     @classmethod
@@ -86,9 +133,41 @@ MemoryStrategyRegistry.register_strategy('buffer')
 MemoryStrategyRegistry.register_strategy('summary')
 MemoryStrategyRegistry.register_strategy('summary_buffer')
 
+class _NullPersistentStore(MemoryStore):
+    """
+    Almacenamiento nulo: no guarda nada
+    Se usa cuando no se proporciona almacenamiento persistente, para que la memoria
+    sea puramente en RAM y no genere E/S de disco
+    """
+    def save(self, key: str, value: Any):
+        """No hace nada"""
+
+    def save_many(self, items: List[Tuple[str, Any]]):
+        """No hace nada"""
+
+    def load(self, key: str) -> Any:
+        """Nunca hay valores almacenados"""
+        return None
+
+    def exists(self, key: str) -> bool:
+        """Nunca hay claves almacenadas"""
+        return False
+
+    def get_all_keys(self) -> Sequence[str]:
+        """Nunca hay claves almacenadas"""
+        return ()
+
+    def clear(self):
+        """No hace nada"""
+
 class PersistentMemoryStore(MemoryStore):
     """
     Almacenamiento persistente para memoria
+    
+    Los datos viven en una base SQLite en modo WAL (junto a file_path, con extensión
+    .db): cada escritura es una inserción en el WAL y cada lectura una búsqueda por
+    clave primaria, sin reescribir ni cargar todo el almacén. Si aún no existe la base
+    y sí un almacén JSON anterior en file_path, se importa al crearla.
     """
     def __init__(self, file_path: str = 'memory_store.json'):
         """
@@ -98,27 +177,46 @@ class PersistentMemoryStore(MemoryStore):
             file_path: Ruta del archivo para almacenar la memoria
         """
         self.file_path = file_path
-        self._data: Dict[str, Any] = self._load()
+        self.db_path = os.path.splitext(file_path)[0] + '.db'
+        # Una conexión compartida entre hilos; el lock serializa su uso
+        self._lock = threading.RLock()
+        # Tupla de claves calculada bajo demanda; None tras cualquier escritura
+        self._keys_cache: Optional[Tuple[str, ...]] = None
+        
+        migrate = not os.path.exists(self.db_path)
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS kv(k TEXT PRIMARY KEY, v BLOB, ts REAL)")
+        # Cerrar la conexión al recolectar el almacén o al salir del proceso
+        weakref.finalize(self, self._conn.close)
+        
+        if migrate:
+            legacy = self._load_legacy_json()
+            if legacy:
+                self.save_many(list(legacy.items()))
 
-    def _load(self) -> Dict[str, Any]:
+    def _load_legacy_json(self) -> Dict[str, Any]:
         """
-        Carga los datos desde el archivo
+        Carga un almacén JSON anterior guardado en file_path
         
         Returns:
-            Diccionario de datos de memoria
+            Diccionario con los datos, vacío si no hay almacén anterior
         """
         try:
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                data = _loads(f.read())
+        except (FileNotFoundError, ValueError):
             return {}
+        
+        return data if isinstance(data, dict) else {}
 
-    def _save(self):
+    def close(self):
         """
-        Guarda los datos en el archivo
+        Cierra la conexión con la base de datos
         """
-        with open(self.file_path, 'w') as f:
-            json.dump(self._data, f, indent=2)
+        with self._lock:
+            self._conn.close()
 
     def save(self, key: str, value: Any):
         """
@@ -128,8 +226,32 @@ class PersistentMemoryStore(MemoryStore):
             key: Clave para almacenar el valor
             value: Valor a almacenar
         """
-        self._data[key] = value
-        self._save()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv VALUES(?, ?, ?)",
+                (key, _dumps(value), time.time())
+            )
+            self._keys_cache = None
+
+    def save_many(self, items: List[Tuple[str, Any]]):
+        """
+        Guarda varios valores en una sola transacción
+        
+        Args:
+            items: Pares (clave, valor) a almacenar
+        """
+        now = time.time()
+        rows = [(key, _dumps(value), now) for key, value in items]
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                conn.executemany("INSERT OR REPLACE INTO kv VALUES(?, ?, ?)", rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self._keys_cache = None
 
     def load(self, key: str) -> Any:
         """
@@ -141,7 +263,9 @@ class PersistentMemoryStore(MemoryStore):
         Returns:
             Valor almacenado
         """
-        return self._data.get(key)
+        with self._lock:
+            row = self._conn.execute("SELECT v FROM kv WHERE k = ?", (key,)).fetchone()
+        return _loads(row[0]) if row is not None else None
 
     def exists(self, key: str) -> bool:
         """
@@ -153,23 +277,33 @@ class PersistentMemoryStore(MemoryStore):
         Returns:
             True si la clave existe, False en caso contrario
         """
-        return key in self._data
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM kv WHERE k = ?", (key,)).fetchone() is not None
 
-    def get_all_keys(self) -> List[str]:
+    def get_all_keys(self) -> Sequence[str]:
         """
         Obtiene todas las claves almacenadas
         
+        La consulta solo se repite si hubo escrituras desde la llamada anterior.
+        
         Returns:
-            Lista de claves
-        """
-        return list(self._data.keys())
+            Tupla de claves, en orden de escritura
+        """
+        with self._lock:
+            keys = self._keys_cache
+            if keys is None:
+                keys = self._keys_cache = tuple(
+                    row[0] for row in self._conn.execute("SELECT k FROM kv ORDER BY rowid")
+                )
+            return keys
 
     def clear(self):
         """
         Limpia todos los datos almacenados
         """
-        self._data.clear()
-        self._save()
+        with self._lock:
+            self._conn.execute("DELETE FROM kv")
+            self._keys_cache = None
 
 def messages_from_dict(message_dicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -189,6 +323,55 @@ def messages_from_dict(message_dicts: List[Dict[str, Any]]) -> List[Dict[str, An
         } for msg in message_dicts
     ]
 
+def _drain_persist_queue(pending: queue.Queue, store: MemoryStore):
+    """
+    Extrae los mensajes pendientes en lotes y los guarda en el almacenamiento persistente
+    
+    Se ejecuta en el hilo de persistencia de cada gestor hasta recibir _PERSIST_STOP.
+    No recibe el gestor, para que el hilo no lo mantenga vivo.
+    
+    Args:
+        pending: Cola de pares (clave, mensaje)
+        store: Almacenamiento donde guardarlos
+    """
+    stopping = False
+    while not stopping:
+        item = pending.get()
+        if item is _PERSIST_STOP:
+            pending.task_done()
+            return
+        
+        items = [item]
+        while len(items) < PERSIST_BATCH_SIZE:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is _PERSIST_STOP:
+                pending.task_done()
+                stopping = True
+                break
+            items.append(item)
+        
+        try:
+            store.save_many(items)
+        except Exception as e:
+            logger.error(f"Error guardando mensajes en memoria persistente: {e}", exc_info=True)
+        finally:
+            for _ in items:
+                pending.task_done()
+
+def _stop_persist_thread(pending: queue.Queue, thread: threading.Thread):
+    """
+    Detiene un hilo de persistencia tras guardar lo que quede en su cola
+    
+    Args:
+        pending: Cola que drena el hilo
+        thread: Hilo de persistencia
+    """
+    pending.put(_PERSIST_STOP)
+    thread.join()
+
 class BaseMemoryManager:
     """
     Gestor de memoria base con funcionalidades genéricas
@@ -199,7 +382,7 @@ class BaseMemoryManager:
         self, 
         memory_type: str = 'summary_buffer',
         max_token_limit: int = 1000,
-        persistent_store: Optional[PersistentMemoryStore] = None,
+        persistent_store: Optional[MemoryStore] = None,
         **strategy_kwargs
     ):
         """
@@ -208,14 +391,15 @@ class BaseMemoryManager:
         Args:
             memory_type: Tipo de estrategia de memoria
             max_token_limit: Límite máximo de tokens
-            persistent_store: Almacenamiento persistente opcional
+            persistent_store: Almacenamiento persistente opcional; si es None, los mensajes
+                solo se guardan en memoria
             strategy_kwargs: Argumentos adicionales para la estrategia de memoria
         """
         self.memory_type = memory_type
         self.max_token_limit = max_token_limit
         
-        # Usar almacenamiento persistente predeterminado si no se proporciona
-        self.persistent_store = persistent_store or PersistentMemoryStore('memory_store.json')
+        # Sin almacenamiento persistente, usar uno nulo (sin E/S de disco)
+        self.persistent_store = persistent_store if persistent_store is not None else _NullPersistentStore()
         
         # Obtener estrategia de memoria
         strategy = MemoryStrategyRegistry.get_strategy(memory_type)
@@ -228,6 +412,61 @@ class BaseMemoryManager:
         
         # Inicializar almacenamiento de mensajes
         self._messages: List[Dict[str, Any]] = []
+        # Líneas "tipo: contenido" del historial, mantenidas al añadir mensajes, y su
+        # unión cacheada hasta el siguiente mensaje
+        self._history_parts: List[str] = []
+        self._history_cache: Optional[str] = None
+        # Secuencia que desambigua las claves si el reloj no avanza entre dos mensajes
+        self._msg_seq = itertools.count()
+        
+        # Los mensajes se persisten en lotes desde un hilo propio, fuera del camino del mensaje;
+        # con el almacenamiento nulo no hay nada que escribir, así que ni se encolan
+        self._persist_queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+        self._persist_closer = None
+        if persistent_store is None:
+            self._persist_message = self.persistent_store.save
+        else:
+            self._persist_message = self._enqueue_persist
+            persist_thread = threading.Thread(
+                target=_drain_persist_queue,
+                args=(self._persist_queue, self.persistent_store),
+                name="memory-persist",
+                daemon=True
+            )
+            persist_thread.start()
+            # Vaciar la cola y detener el hilo en close(), al recolectar el gestor o
+            # al salir del proceso, lo que ocurra primero
+            self._persist_closer = weakref.finalize(
+                self, _stop_persist_thread, self._persist_queue, persist_thread
+            )
+
+    def _enqueue_persist(self, key: str, value: Dict[str, Any]):
+        """
+        Encola un mensaje para que el hilo de persistencia lo guarde
+        
+        Args:
+            key: Clave del mensaje
+            value: Mensaje a guardar
+        """
+        self._persist_queue.put((key, value))
+
+    def flush(self):
+        """
+        Espera a que todos los mensajes pendientes se hayan guardado
+        """
+        self._persist_queue.join()
+        self.persistent_store.flush()
+
+    def close(self):
+        """
+        Guarda los mensajes pendientes y detiene el hilo de persistencia
+        
+        Los mensajes añadidos después se guardan de forma síncrona.
+        """
+        if self._persist_closer is not None:
+            self._persist_message = self.persistent_store.save
+            self._persist_closer()
+        self.flush()
 
     def add_user_message(self, message: str):
         """
@@ -237,16 +476,19 @@ class BaseMemoryManager:
             message: Mensaje de usuario
         """
         try:
+            now_ns = time.time_ns()
             message_entry = {
                 "type": "human",
                 "content": message,
-                "timestamp": time.time()
+                "timestamp": now_ns / 1e9
             }
             self._messages.append(message_entry)
+            self._history_parts.append(f"human: {message}")
+            self._history_cache = None
             
-            # Almacenar en memoria persistente
-            message_key = f"user_message_{int(time.time())}"
-            self.persistent_store.save(message_key, message_entry)
+            # Almacenar en memoria persistente (en segundo plano)
+            message_key = f"user_message_{now_ns}_{next(self._msg_seq)}"
+            self._persist_message(message_key, message_entry)
         except Exception as e:
             logger.error(f"Error añadiendo mensaje de usuario: {e}", exc_info=True)
 
@@ -258,16 +500,19 @@ class BaseMemoryManager:
             message: Mensaje de IA
         """
         try:
+            now_ns = time.time_ns()
             message_entry = {
                 "type": "ai",
                 "content": message,
-                "timestamp": time.time()
+                "timestamp": now_ns / 1e9
             }
             self._messages.append(message_entry)
+            self._history_parts.append(f"ai: {message}")
+            self._history_cache = None
             
-            # Almacenar en memoria persistente
-            message_key = f"ai_message_{int(time.time())}"
-            self.persistent_store.save(message_key, message_entry)
+            # Almacenar en memoria persistente (en segundo plano)
+            message_key = f"ai_message_{now_ns}_{next(self._msg_seq)}"
+            self._persist_message(message_key, message_entry)
         except Exception as e:
             logger.error(f"Error añadiendo mensaje de IA: {e}", exc_info=True)
 
@@ -290,6 +535,10 @@ class BaseMemoryManager:
         """
         try:
             self._messages.clear()
+            self._history_parts.clear()
+            self._history_cache = None
+            # Evitar que escrituras pendientes reaparezcan tras limpiar
+            self.flush()
             self.persistent_store.clear()
         except Exception as e:
             logger.error(f"Error limpiando memoria: {e}", exc_info=True)
@@ -305,28 +554,41 @@ class BaseMemoryManager:
             Variables de memoria
         """
         try:
-            return {"history": "\n".join([f"{msg['type']}: {msg['content']}" for msg in self._messages])}
+            if self._history_cache is None:
+                self._history_cache = "\n".join(self._history_parts)
+            return {"history": self._history_cache}
         except Exception as e:
             logger.error(f"Error cargando variables de memoria: {e}", exc_info=True)
             return {}
 
-    def export_memory(self, file_path: str) -> bool:
+    def export_memory(self, file_path: str, pretty: bool = False) -> bool:
         """
         Exporta el contexto completo de la memoria a un archivo
         
         Args:
             file_path: Ruta para exportar la memoria
+            pretty: Si se escribe JSON indentado (para depuración) en lugar de compacto
         
         Returns:
             True si la exportación fue exitosa, False en caso contrario
         """
+        # Escribir en un temporal y reemplazar el destino de forma atómica, para que
+        # una interrupción no deje un archivo truncado que import_memory no pueda leer
+        tmp_path = file_path + '.tmp'
         try:
-            memory_context = self.get_memory_context()
-            with open(file_path, 'w') as f:
-                json.dump(memory_context, f, indent=2)
+            data = _dumps(self.get_memory_context(), pretty=pretty)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
             logger.error(f"Error exportando memoria: {e}", exc_info=True)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
 
     def import_memory(self, file_path: str) -> bool:
@@ -340,8 +602,8 @@ class BaseMemoryManager:
             True si la importación fue exitosa, False en caso contrario
         """
         try:
-            with open(file_path, 'r') as f:
-                memory_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                memory_data = _loads(f.read())
             
             # Limpiar memoria existente
             self.clear_memory()
@@ -349,12 +611,21 @@ class BaseMemoryManager:
             # Reconstruir mensajes
             messages = messages_from_dict(memory_data)
             
-            # Añadir mensajes de vuelta a la memoria
+            # Añadir mensajes de vuelta a la memoria en bloque y guardarlos con una sola
+            # escritura, en lugar de pasar uno a uno por add_user_message/add_ai_message
+            now_ns = time.time_ns()
+            items = []
             for msg in messages:
-                if msg['type'] == 'human':
-                    self.add_user_message(msg['content'])
-                elif msg['type'] == 'ai':
-                    self.add_ai_message(msg['content'])
+                key_prefix = _MESSAGE_KEY_PREFIXES.get(msg['type'])
+                if key_prefix is None:
+                    continue
+                self._messages.append(msg)
+                self._history_parts.append(f"{msg['type']}: {msg['content']}")
+                items.append((f"{key_prefix}_{now_ns}_{next(self._msg_seq)}", msg))
+            self._history_cache = None
+            
+            if items:
+                self.persistent_store.save_many(items)
             
             return True
         except Exception as e:
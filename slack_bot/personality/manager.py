@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any, Optional
 
 from slack_bot.config import settings
+from slack_bot.personality.templates import template_manager
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,18 @@ class PersonalityManager:
                     "templates": getattr(personality_module, "TEMPLATES", {})
                 }
             
+            # Las personalidades pueden definir el prompt como plantilla registrada
+            if not personality_config.get("system_prompt") and personality_config.get("system_prompt_template"):
+                personality_config["system_prompt"] = (
+                    template_manager.format_template(personality_config["system_prompt_template"]) or ""
+                )
+            
+            # Construir una sola vez el mensaje de sistema que se envía al LLM en cada turno
+            personality_config["system_message"] = {
+                "role": "system",
+                "content": personality_config.get("system_prompt", "")
+            }
+            
             # Almacenar configuración
             self.personalities[personality_name] = personality_config
             logger.info(f"Personalidad {personality_name} cargada exitosamente")
@@ -117,6 +130,29 @@ class PersonalityManager:
         
         return self.personalities[personality].get("system_prompt", "")
     
+    def get_system_message(self, personality_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        Obtiene el mensaje de sistema precalculado para la personalidad especificada.
+        
+        El diccionario se construye al cargar la personalidad y se comparte entre
+        llamadas, por lo que no debe modificarse.
+        
+        Args:
+            personality_name (Optional[str]): Nombre de la personalidad.
+                Si es None, se usa la personalidad activa.
+                
+        Returns:
+            Dict[str, str]: Mensaje {"role": "system", "content": ...} listo para la API del LLM.
+        """
+        personality = personality_name or self.active_personality
+        
+        if personality not in self.personalities:
+            if not self._load_personality(personality):
+                logger.warning(f"Personalidad {personality} no encontrada, usando la activa")
+                personality = self.active_personality
+        
+        return self.personalities[personality]["system_message"]
+    
     def get_response_config(self, personality_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Obtiene la configuración de respuesta para la personalidad especificada.
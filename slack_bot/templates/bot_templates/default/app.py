@@ -89,8 +89,10 @@ def create_bot():
     )
     
     # Registrar manejadores de eventos
-    slack_connector.register_event_handler("message", event_handler.handle_message)
-    slack_connector.register_event_handler("app_mention", event_handler.handle_mention)
+    slack_connector.register_event_handlers({
+        "message": event_handler.handle_message,
+        "app_mention": event_handler.handle_mention
+    })
     
     return slack_connector, event_handler, personality_manager, context_manager
 
@@ -100,6 +102,9 @@ def main():
     Función principal para iniciar el bot.
     """
     try:
+        # Validar configuración crítica antes de crear nada
+        settings.validate_config()
+        
         # Crear bot
         slack_connector, event_handler, personality_manager, context_manager = create_bot()
         
@@ -114,6 +119,12 @@ def main():
         print("1. Mensajes directos")
         print("2. Menciones en canales")
         print("=" * 50)
+        
+        # Esperar eventos sin consumir CPU hasta que se cierre la conexión
+        try:
+            slack_connector.wait()
+        except KeyboardInterrupt:
+            slack_connector.disconnect()
     
     except Exception as e:
         logger.error(f"Error al iniciar el bot: {e}", exc_info=True)
@@ -85,15 +85,17 @@ def test_bot_connection(mock_socket_handler, mock_app):
     )
     
     # Registrar manejadores de eventos
-    connector.register_event_handler("message", event_handler.handle_message)
-    connector.register_event_handler("app_mention", event_handler.handle_mention)
+    connector.register_event_handlers({
+        "message": event_handler.handle_message,
+        "app_mention": event_handler.handle_mention
+    })
     
     # Simular conexión
     connection_result = connector.connect()
     
     assert connection_result is True, "La conexión del bot debe ser exitosa"
     mock_socket_handler.assert_called_once()
-    mock_handler_instance.start.assert_called_once()
+    mock_handler_instance.connect.assert_called_once()
 
 
 def test_environment_variables():
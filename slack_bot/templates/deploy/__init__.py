@@ -0,0 +1,5 @@
+"""
+Recursos para el despliegue del bot en Google Compute Engine.
+
+Contiene setup.sh, el script que configura la instancia tras copiar los archivos.
+"""
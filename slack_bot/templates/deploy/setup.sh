@@ -0,0 +1,61 @@
+#!/bin/bash
+
+# Actualizar sistema
+echo "Actualizando sistema..."
+sudo apt-get update
+sudo apt-get upgrade -y
+
+# Instalar dependencias
+echo "Instalando dependencias..."
+sudo apt-get install -y python3 python3-pip python3-venv git supervisor
+
+# Crear directorio para el bot
+echo "Configurando directorio del bot..."
+mkdir -p ~/slack_bot
+
+# Mover archivos al directorio del bot
+echo "Moviendo archivos..."
+mv ./* ~/slack_bot/ 2>/dev/null || true
+
+# Crear entorno virtual
+echo "Creando entorno virtual..."
+cd ~/slack_bot
+python3 -m venv venv
+source venv/bin/activate
+
+# Instalar dependencias
+echo "Instalando dependencias de Python..."
+pip install --upgrade pip
+pip install -r requirements.txt
+
+# Crear archivo de configuración para supervisor
+echo "Configurando supervisor..."
+cat > slack_bot.conf << EOT
+[program:slack_bot]
+command=/home/$(whoami)/slack_bot/venv/bin/python /home/$(whoami)/slack_bot/app.py
+directory=/home/$(whoami)/slack_bot
+autostart=true
+autorestart=true
+startretries=10
+user=$(whoami)
+redirect_stderr=true
+stdout_logfile=/home/$(whoami)/slack_bot/slack_bot.log
+stdout_logfile_maxbytes=50MB
+stdout_logfile_backups=10
+environment=PYTHONUNBUFFERED=1
+EOT
+
+# Instalar el servicio
+echo "Instalando servicio..."
+sudo mv slack_bot.conf /etc/supervisor/conf.d/
+sudo supervisorctl reread
+sudo supervisorctl update
+sudo supervisorctl start slack_bot
+
+# Verificar estado del servicio
+echo "Verificando estado del servicio..."
+sudo supervisorctl status slack_bot
+
+echo "¡Configuración completada!"
+echo "El bot está ahora ejecutándose como un servicio."
+echo "Puedes ver los logs en: ~/slack_bot/slack_bot.log"
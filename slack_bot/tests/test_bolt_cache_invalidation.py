@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("cachetools")
+pytest.importorskip("groq")
+
+from slack_bot.connectors import slack_bolt
+
+
+class FakeClient:
+    def __init__(self):
+        self.retry_handlers = []
+        self.calls = 0
+
+    def conversations_info(self, channel):
+        self.calls += 1
+        return {"ok": True, "channel": {"id": channel, "name": f"name-{self.calls}"}}
+
+
+class FakeApp:
+    """Stand-in for slack_bolt.App that records event listeners instead of calling Slack"""
+
+    def __init__(self, token):
+        self.client = FakeClient()
+        self.listeners = {}
+
+    def event(self, event_type):
+        def register(func):
+            self.listeners.setdefault(str(event_type), []).append(func)
+            return func
+        return register
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    monkeypatch.setattr(slack_bolt, "App", FakeApp)
+    return slack_bolt.BoltConnector(bot_token="xoxb-test", app_token="xapp-test")
+
+
+def test_rename_and_user_change_listeners_are_registered(connector):
+    """Test that cache invalidation listens to rename and profile events"""
+    assert {"channel_rename", "group_rename", "user_change"} <= set(connector.app.listeners)
+
+
+def test_channel_rename_invalidates_cached_channel(connector):
+    """Test that a rename event makes the next lookup hit the API again"""
+    assert connector.get_channel_info("C1")["channel"]["name"] == "name-1"
+    assert connector.get_channel_info("C1")["channel"]["name"] == "name-1"
+    
+    for listener in connector.app.listeners["channel_rename"]:
+        listener(event={"type": "channel_rename", "channel": {"id": "C1", "name": "nuevo"}})
+    
+    assert connector.get_channel_info("C1")["channel"]["name"] == "name-2"
+
+
+def test_user_change_invalidates_cached_user(connector):
+    """Test that a user_change event drops the cached profile"""
+    connector._user_cache["U1"] = {"ok": True}
+    
+    for listener in connector.app.listeners["user_change"]:
+        listener(event={"type": "user_change", "user": {"id": "U1"}})
+    
+    assert "U1" not in connector._user_cache
@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+
+from slack_bot.utils import error_handling
+from slack_bot.utils.error_handling import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Controllable replacement for the time module used by the breaker"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(error_handling, "time", fake)
+    return fake
+
+
+def _fail():
+    raise RuntimeError("service down")
+
+
+def _trip(breaker):
+    """Make fail_max consecutive failing calls"""
+    for _ in range(breaker.fail_max):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+
+
+def test_opens_after_fail_max_consecutive_failures(clock):
+    """Test closed -> open after fail_max failures, rejecting calls without running them"""
+    breaker = CircuitBreaker("svc", fail_max=3, reset_timeout=10)
+    _trip(breaker)
+
+    assert breaker.is_open
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, 1)
+    assert calls == []
+
+
+def test_success_resets_failure_count(clock):
+    """Test that failures must be consecutive to open the circuit"""
+    breaker = CircuitBreaker("svc", fail_max=2, reset_timeout=10)
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+
+    assert not breaker.is_open
+
+
+def test_successful_probe_closes_circuit(clock):
+    """Test open -> half-open -> closed when the trial call succeeds"""
+    breaker = CircuitBreaker("svc", fail_max=1, reset_timeout=10)
+    _trip(breaker)
+
+    clock.now += 10
+    assert not breaker.is_open
+    assert breaker.call(lambda: "ok") == "ok"
+
+    assert not breaker.is_open
+    # Closed again: the next failure counts from zero
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.is_open
+
+
+def test_failed_probe_doubles_open_interval_up_to_cap(clock):
+    """Test exponential backoff on reopen, capped at max_reset_timeout"""
+    breaker = CircuitBreaker("svc", fail_max=1, reset_timeout=10, max_reset_timeout=25)
+    _trip(breaker)
+    clock.now += 10
+
+    for expected_interval in (20, 25, 25):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+        clock.now += expected_interval - 0.1
+        assert breaker.is_open
+        clock.now += 0.1
+        assert not breaker.is_open
+
+    # A successful probe resets the interval to reset_timeout
+    breaker.call(lambda: None)
+    _trip(breaker)
+    clock.now += 10
+    assert not breaker.is_open
+
+
+def test_half_open_allows_a_single_probe(clock):
+    """Test that concurrent callers are rejected while the trial call runs"""
+    breaker = CircuitBreaker("svc", fail_max=1, reset_timeout=10)
+    _trip(breaker)
+    clock.now += 10
+
+    probe_started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def slow_probe():
+        probe_started.set()
+        release.wait(2)
+        return "ok"
+
+    thread = threading.Thread(target=lambda: results.append(breaker.call(slow_probe)))
+    thread.start()
+    try:
+        assert probe_started.wait(2)
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "second")
+    finally:
+        release.set()
+        thread.join()
+
+    assert results == ["ok"]
+    assert not breaker.is_open
@@ -0,0 +1,92 @@
+import asyncio
+
+from slack_bot.cli import deploy
+
+
+def _fake_run_command(monkeypatch, returncode, stdout, stderr=""):
+    """Replace run_command with a coroutine returning a fixed result and recording the command"""
+    calls = []
+    
+    async def run_command(command, cwd=None):
+        calls.append(command)
+        return returncode, stdout, stderr
+    
+    monkeypatch.setattr(deploy, "run_command", run_command)
+    return calls
+
+
+def test_check_instances_exist_uses_one_filtered_list_call(monkeypatch):
+    """Test that all instances are probed with a single gcloud list call"""
+    calls = _fake_run_command(monkeypatch, 0, '[{"name": "bot-a"}]')
+    
+    result = asyncio.run(deploy.check_instances_exist(["bot-a", "bot-b"], "us-central1-a"))
+    
+    assert result == {"bot-a": True, "bot-b": False}
+    assert len(calls) == 1
+    command = calls[0]
+    assert command[:4] == ["gcloud", "compute", "instances", "list"]
+    assert "--filter=name:(bot-a OR bot-b)" in command
+    assert "--format=json(name)" in command
+
+
+def test_check_instances_exist_handles_empty_output(monkeypatch):
+    """Test that an empty stdout means no instance exists"""
+    _fake_run_command(monkeypatch, 0, "")
+    
+    assert asyncio.run(deploy.check_instances_exist(["bot-a"], "zone")) == {"bot-a": False}
+
+
+def test_check_instances_exist_reports_unknown_on_gcloud_errors(monkeypatch):
+    """Test that a failing gcloud call is unknown, not 'every instance is missing'"""
+    _fake_run_command(monkeypatch, 1, "", "permission denied")
+    
+    assert asyncio.run(deploy.check_instances_exist(["bot-a", "bot-b"], "zone")) is None
+
+
+def test_check_instances_exist_reports_unknown_on_malformed_json(monkeypatch):
+    """Test that unexpected output shapes are logged and reported as unknown"""
+    for stdout in ("not json", '[{"id": 1}]', '{"name": "bot-a"}'):
+        _fake_run_command(monkeypatch, 0, stdout)
+        assert asyncio.run(deploy.check_instances_exist(["bot-a"], "zone")) is None
+
+
+def test_check_instance_exists_delegates_to_batched_probe(monkeypatch):
+    """Test the single-instance helper on top of the batched probe"""
+    _fake_run_command(monkeypatch, 0, '[{"name": "bot-a"}]')
+    
+    assert asyncio.run(deploy.check_instance_exists("bot-a", "zone")) is True
+
+
+def test_deploy_aborts_without_creating_when_probe_fails(monkeypatch, tmp_path):
+    """Test that --create-instance never creates instances after a failed probe"""
+    _fake_run_command(monkeypatch, 1, "", "quota exceeded")
+    archive = tmp_path / "bundle.tar.gz"
+    archive.write_bytes(b"")
+    created = []
+    
+    async def create_instance(*args):
+        created.append(args)
+        return True
+    
+    monkeypatch.setattr(deploy, "build_deployment_archive", lambda project_dir: str(archive))
+    monkeypatch.setattr(deploy, "create_instance", create_instance)
+    
+    ok = asyncio.run(deploy.deploy_async(
+        str(tmp_path), ["bot-a", "bot-b"], "zone", create_instance_if_not_exists=True
+    ))
+    
+    assert ok is False
+    assert created == []
+    assert not archive.exists()
+
+
+def test_deploy_one_aborts_when_single_probe_fails(monkeypatch):
+    """Test that an unknown single-instance probe cancels the deploy"""
+    _fake_run_command(monkeypatch, 1, "", "network error")
+    
+    async def create_instance(*args):
+        raise AssertionError("must not create after a failed probe")
+    
+    monkeypatch.setattr(deploy, "create_instance", create_instance)
+    
+    assert asyncio.run(deploy.deploy_one("bundle.tar.gz", "bot-a", "zone", True)) is False
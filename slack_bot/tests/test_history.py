@@ -0,0 +1,101 @@
+import pytest
+
+from slack_bot.context.history import ConversationHistory
+from slack_bot.context.manager import ContextManager
+
+
+def test_messages_is_a_read_only_snapshot():
+    """Test that mutating history.messages fails loudly instead of being ignored"""
+    history = ConversationHistory("C1")
+    history.add_message("user", "hola")
+    history.add_message("assistant", "buenas")
+    
+    messages = history.messages
+    
+    assert [(m["role"], m["content"]) for m in messages] == [("user", "hola"), ("assistant", "buenas")]
+    with pytest.raises(AttributeError):
+        messages.append({"role": "user", "content": "x"})
+    with pytest.raises(AttributeError):
+        messages.clear()
+    
+    history.clear()
+    assert history.messages == ()
+
+
+def test_max_bytes_evicts_oldest_messages():
+    """Test that the byte budget drops the oldest messages first"""
+    history = ConversationHistory("C1", max_bytes=10)
+    history.add_message("user", "aaaa")
+    history.add_message("assistant", "bbbb")
+    history.add_message("user", "cccc")
+    
+    assert [m["content"] for m in history.messages] == ["bbbb", "cccc"]
+    assert history.get_summary()["user_messages"] == 1
+    assert history.get_summary()["assistant_messages"] == 1
+
+
+def test_max_bytes_counts_utf8_bytes_and_keeps_last_message():
+    """Test that sizes are UTF-8 bytes and an oversized message is still kept"""
+    history = ConversationHistory("C1", max_bytes=4)
+    history.add_message("user", "ññ")
+    assert len(history.messages) == 1
+    
+    history.add_message("user", "ñ" * 10)
+    assert [m["content"] for m in history.messages] == ["ñ" * 10]
+
+
+def test_max_bytes_combines_with_max_messages_and_round_trips():
+    """Test maxlen eviction keeps the byte total in sync and to_dict/from_dict keep the budget"""
+    history = ConversationHistory("C1", max_messages=2, max_bytes=8)
+    for content in ("aa", "bb", "cc", "dddd"):
+        history.add_message("user", content)
+    assert [m["content"] for m in history.messages] == ["cc", "dddd"]
+    
+    restored = ConversationHistory.from_dict(history.to_dict())
+    assert restored.max_bytes == 8
+    restored.add_message("user", "eeee")
+    assert [m["content"] for m in restored.messages] == ["dddd", "eeee"]
+
+
+def test_context_manager_add_messages_matches_add_message():
+    """Test that add_messages appends in order like repeated add_message calls"""
+    batched = ContextManager(max_messages=10, expiry_minutes=60)
+    single = ContextManager(max_messages=10, expiry_minutes=60)
+    
+    batched.add_messages("U1", "C1", [("hola", False), ("buenas", True)])
+    single.add_message("U1", "C1", "hola")
+    single.add_message("U1", "C1", "buenas", is_bot=True)
+    
+    def strip(history):
+        return [(m["role"], m["content"]) for m in history]
+    
+    assert strip(batched.get_conversation_history("U1", "C1")) == [("user", "hola"), ("assistant", "buenas")]
+    assert strip(batched.get_conversation_history("U1", "C1")) == strip(single.get_conversation_history("U1", "C1"))
+    formatted, _ = batched.get_formatted_history("U1", "C1")
+    assert formatted == [{"role": "user", "content": "hola"}, {"role": "assistant", "content": "buenas"}]
+
+
+def test_context_manager_add_messages_respects_max_messages():
+    """Test that batched messages are bounded by max_messages"""
+    manager = ContextManager(max_messages=2, expiry_minutes=60)
+    
+    manager.add_messages("U1", "C1", [("uno", False), ("dos", True), ("tres", False)])
+    
+    assert [m["content"] for m in manager.get_conversation_history("U1", "C1")] == ["dos", "tres"]
+
+
+@pytest.mark.parametrize("max_messages", [0, -1])
+def test_max_messages_below_one_is_rejected(max_messages):
+    """Test that an empty message window fails at construction instead of on add_message"""
+    with pytest.raises(ValueError):
+        ConversationHistory("C1", max_messages=max_messages)
+
+
+def test_max_messages_of_one_keeps_only_the_last_message():
+    """Test the smallest valid window evicts on every add"""
+    history = ConversationHistory("C1", max_messages=1)
+    history.add_message("user", "hola")
+    history.add_message("assistant", "buenas")
+    
+    assert [m["content"] for m in history.messages] == ["buenas"]
+    assert history.get_summary()["user_messages"] == 0
@@ -1,6 +1,9 @@
+import gc
 import pytest
 import os
 import json
+import threading
+import weakref
 from slack_bot.context.memory import (
     BaseMemoryManager, 
     MemoryStrategyRegistry, 
@@ -90,8 +93,9 @@ def test_memory_persistence():
     persistent_store = PersistentMemoryStore('test_memory_persistence.json')
     memory_manager = BaseMemoryManager(persistent_store=persistent_store)
     
-    # Add a message
+    # Add a message and wait for the background write
     memory_manager.add_user_message("Persistent memory test")
+    memory_manager.flush()
     
     # Check persistent store
     keys = persistent_store.get_all_keys()
@@ -102,6 +106,37 @@ def test_memory_persistence():
     stored_data = persistent_store.load(keys[0])
     assert stored_data['type'] == 'human'
 
+def test_memory_close_persists_pending_messages(tmp_path):
+    """Test that close() drains the write queue and stops the persist thread"""
+    persistent_store = PersistentMemoryStore(str(tmp_path / 'store.json'))
+    threads_before = set(threading.enumerate())
+    memory_manager = BaseMemoryManager(memory_type='buffer', persistent_store=persistent_store)
+    (persist_thread,) = set(threading.enumerate()) - threads_before
+    
+    for i in range(10):
+        memory_manager.add_user_message(f"message {i}")
+    memory_manager.close()
+    
+    assert len(persistent_store.get_all_keys()) == 10
+    assert not persist_thread.is_alive()
+    
+    # After close, messages are written synchronously
+    memory_manager.add_ai_message("after close")
+    assert len(persistent_store.get_all_keys()) == 11
+
+def test_memory_manager_is_collectable(tmp_path):
+    """Test that the persist thread does not keep its manager alive"""
+    persistent_store = PersistentMemoryStore(str(tmp_path / 'store.json'))
+    memory_manager = BaseMemoryManager(memory_type='buffer', persistent_store=persistent_store)
+    memory_manager.add_user_message("pending")
+    manager_ref = weakref.ref(memory_manager)
+    
+    del memory_manager
+    gc.collect()
+    
+    assert manager_ref() is None
+    assert len(persistent_store.get_all_keys()) == 1
+
 def test_invalid_memory_strategy():
     """Test handling of invalid memory strategy"""
     with pytest.raises(ValueError, match="Estrategia de memoria no registrada"):
@@ -0,0 +1,113 @@
+import json
+import sqlite3
+
+import pytest
+
+from slack_bot.context.memory import PersistentMemoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fresh SQLite-backed store in a temporary directory"""
+    persistent_store = PersistentMemoryStore(str(tmp_path / 'store.json'))
+    yield persistent_store
+    persistent_store.close()
+
+
+def test_store_uses_sqlite_in_wal_mode(tmp_path, store):
+    """Test that the store lives next to file_path as a WAL-mode SQLite database"""
+    assert store.db_path == str(tmp_path / 'store.db')
+    conn = sqlite3.connect(store.db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    finally:
+        conn.close()
+
+
+def test_save_load_exists_and_clear(store):
+    """Test the basic key-value operations"""
+    store.save('a', {'type': 'human', 'content': 'hola'})
+    store.save('b', [1, 2, 3])
+    
+    assert store.load('a') == {'type': 'human', 'content': 'hola'}
+    assert store.load('missing') is None
+    assert store.exists('b')
+    assert not store.exists('missing')
+    
+    store.clear()
+    assert store.get_all_keys() == ()
+    assert not store.exists('a')
+
+
+def test_save_many_writes_all_items_in_order(store):
+    """Test that save_many stores every pair and keeps insertion order"""
+    store.save('first', 0)
+    store.save_many([('k1', 1), ('k2', 2), ('k3', 3)])
+    
+    assert store.get_all_keys() == ('first', 'k1', 'k2', 'k3')
+    assert [store.load(key) for key in ('k1', 'k2', 'k3')] == [1, 2, 3]
+
+
+def test_save_many_rolls_back_on_error(store):
+    """Test that a failing batch leaves no partial writes behind"""
+    store.save('kept', 1)
+    
+    with pytest.raises(TypeError):
+        store.save_many([('new', 2), ('bad', object())])
+    
+    assert store.get_all_keys() == ('kept',)
+
+
+def test_keys_cache_is_invalidated_by_writes(store):
+    """Test that get_all_keys reflects save, save_many and clear"""
+    store.save('a', 1)
+    keys = store.get_all_keys()
+    assert store.get_all_keys() is keys
+    
+    store.save('b', 2)
+    assert store.get_all_keys() == ('a', 'b')
+    store.save_many([('c', 3)])
+    assert store.get_all_keys() == ('a', 'b', 'c')
+    store.clear()
+    assert store.get_all_keys() == ()
+
+
+def test_data_survives_reopening(tmp_path, store):
+    """Test that a new store over the same path sees earlier writes"""
+    store.save('a', {'content': 'persistente'})
+    store.close()
+    
+    reopened = PersistentMemoryStore(str(tmp_path / 'store.json'))
+    try:
+        assert reopened.load('a') == {'content': 'persistente'}
+    finally:
+        reopened.close()
+
+
+def test_legacy_json_snapshot_is_migrated(tmp_path):
+    """Test that an existing JSON store is imported when the database is created"""
+    legacy = {
+        'user_message_1': {'type': 'human', 'content': 'hola', 'timestamp': 1.0},
+        'ai_message_1': {'type': 'ai', 'content': 'qué tal', 'timestamp': 2.0},
+    }
+    json_path = tmp_path / 'legacy.json'
+    json_path.write_text(json.dumps(legacy, indent=2))
+    
+    migrated = PersistentMemoryStore(str(json_path))
+    try:
+        assert migrated.get_all_keys() == ('user_message_1', 'ai_message_1')
+        assert migrated.load('ai_message_1') == legacy['ai_message_1']
+    finally:
+        migrated.close()
+
+
+def test_invalid_legacy_json_is_ignored(tmp_path):
+    """Test that a corrupt JSON store does not prevent creating the database"""
+    json_path = tmp_path / 'broken.json'
+    json_path.write_text('{"truncated": ')
+    
+    migrated = PersistentMemoryStore(str(json_path))
+    try:
+        assert migrated.get_all_keys() == ()
+    finally:
+        migrated.close()
@@ -0,0 +1,31 @@
+from slack_bot.personality.manager import PersonalityManager
+
+
+def test_system_message_uses_personality_prompt():
+    """Test that the precomputed system message carries the personality's prompt"""
+    manager = PersonalityManager('default')
+    
+    message = manager.get_system_message()
+    
+    assert message['role'] == 'system'
+    assert message['content'] == manager.get_system_prompt()
+    assert message['content']
+
+
+def test_system_message_renders_prompt_template():
+    """Test that personalities defining system_prompt_template get a rendered prompt"""
+    manager = PersonalityManager('lucius')
+    
+    assert 'Lucius Fox' in manager.get_system_message()['content']
+    assert manager.get_system_prompt() == manager.get_system_message()['content']
+
+
+def test_system_message_follows_active_personality():
+    """Test that switching personality switches the system message"""
+    manager = PersonalityManager('default')
+    default_message = manager.get_system_message()
+    
+    assert manager.set_active_personality('lucius')
+    
+    assert manager.get_system_message() is not default_message
+    assert manager.get_system_message() is manager.get_system_message('lucius')
@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+
+from slack_bot.connectors import rate_limit
+from slack_bot.connectors.rate_limit import ChannelRateLimiter, ChannelSendQueue, TokenBucket
+
+
+class FakeTime:
+    """Replacement for the time module: sleep() advances monotonic()"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def test_bucket_allows_burst_then_spaces_calls(fake_time):
+    """Test that capacity tokens go out immediately and later ones wait 1/rate each"""
+    bucket = TokenBucket(rate=2.0, capacity=3)
+    
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Queued reservations: each one waits half a second more than the previous
+    assert [bucket.acquire() for _ in range(3)] == [0.5, 1.0, 1.5]
+    assert fake_time.sleeps == [0.5, 1.0, 1.5]
+
+
+def test_bucket_refills_over_time_up_to_capacity(fake_time):
+    """Test that tokens are replenished at rate but never above capacity"""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    
+    fake_time.now += 1.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 1.0
+    
+    fake_time.now += 60.0
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_channel_limiter_keeps_independent_buckets(fake_time):
+    """Test that one busy channel does not delay another"""
+    limiter = ChannelRateLimiter(rate=1.0, burst=1)
+    
+    assert limiter.acquire("C1") == 0.0
+    assert limiter.acquire("C1") == 1.0
+    assert limiter.acquire("C2") == 0.0
+
+
+def test_channel_limiter_creates_one_bucket_per_channel_across_threads(fake_time):
+    """Test that concurrent first sends to a channel share a single bucket"""
+    limiter = ChannelRateLimiter(rate=1.0, burst=100)
+    barrier = threading.Barrier(8)
+    
+    def send():
+        barrier.wait()
+        limiter.acquire("C1")
+    
+    threads = [threading.Thread(target=send) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert list(limiter._buckets) == ["C1"]
+    assert limiter._buckets["C1"]._tokens == 92
+
+
+def test_bucket_try_acquire_never_waits(fake_time):
+    """Test that try_acquire takes a free token or reports the wait without reserving"""
+    bucket = TokenBucket(rate=2.0, capacity=1)
+    
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.5
+    assert bucket.try_acquire() == 0.5
+    fake_time.now += 0.5
+    assert bucket.try_acquire() == 0.0
+    assert fake_time.sleeps == []
+
+
+def test_channel_limiter_evicts_idle_buckets(fake_time, monkeypatch):
+    """Test that refilled buckets are dropped once the limiter holds too many"""
+    monkeypatch.setattr(rate_limit, "IDLE_BUCKET_PURGE_THRESHOLD", 3)
+    limiter = ChannelRateLimiter(rate=1.0, burst=2)
+    for channel in ("C1", "C2", "C3"):
+        limiter.acquire(channel)
+    
+    fake_time.now += 0.5
+    limiter.acquire("C2")
+    fake_time.now += 1.0
+    # C1 and C3 are full again; C2 still owes a token and keeps its state
+    limiter.acquire("C4")
+    
+    assert sorted(limiter._buckets) == ["C2", "C4"]
+
+
+def test_send_queue_keeps_order_within_a_channel():
+    """Test that sends to one channel run one after another in submission order"""
+    queue = ChannelSendQueue(ChannelRateLimiter(rate=50.0, burst=2), max_workers=4)
+    seen = []
+    
+    futures = [queue.submit("C1", seen.append, n) for n in range(6)]
+    for future in futures:
+        future.result(timeout=2)
+    
+    assert seen == list(range(6))
+
+
+def test_send_queue_rate_limited_channel_does_not_block_others():
+    """Test that a channel waiting for tokens leaves the workers free for other channels"""
+    queue = ChannelSendQueue(ChannelRateLimiter(rate=1.0, burst=1), max_workers=1)
+    
+    busy = [queue.submit("C1", time.monotonic) for _ in range(3)]
+    start = time.monotonic()
+    assert queue.submit("C2", lambda: "sent").result(timeout=0.5) == "sent"
+    
+    assert time.monotonic() - start < 0.5
+    assert busy[0].done()
+    assert not busy[-1].done()
+    for future in busy:
+        future.cancel()
+
+
+def test_send_queue_propagates_errors_and_continues():
+    """Test that a failing send resolves its future with the error and later sends still run"""
+    queue = ChannelSendQueue(None, max_workers=1)
+    
+    def fail():
+        raise RuntimeError("boom")
+    
+    failed = queue.submit("C1", fail)
+    ok = queue.submit("C1", lambda: "ok")
+    
+    assert ok.result(timeout=2) == "ok"
+    assert isinstance(failed.exception(), RuntimeError)
@@ -0,0 +1,12 @@
+from dataclasses import fields
+
+from slack_bot.config import settings
+
+
+def test_every_setting_has_a_module_constant():
+    """Test that each Settings field is declared as an upper-case module constant"""
+    config = settings.get_settings()
+    
+    for field in fields(settings.Settings):
+        assert getattr(settings, field.name.upper()) == getattr(config, field.name), field.name
+        assert field.name.upper() in settings.__annotations__, field.name
@@ -0,0 +1,103 @@
+import threading
+import time
+
+from slack_bot.connectors.worker_pool import WorkerPool
+
+
+def _event(user, **kwargs):
+    """Build handler kwargs the way Bolt passes them for a user's event"""
+    return {"body": {"team_id": "T1", "event": {"user": user}}, **kwargs}
+
+
+def test_events_of_one_user_run_in_order():
+    """Test that a user's events are handled sequentially in submission order"""
+    pool = WorkerPool(num_workers=4, queue_size=16)
+    seen = []
+    done = threading.Event()
+
+    def handler(body, n):
+        time.sleep(0.001 * (5 - n))
+        seen.append(n)
+        if n == 4:
+            done.set()
+
+    pool.register("message", handler)
+    pool.start()
+    try:
+        for n in range(5):
+            pool.submit("message", _event("U1", n=n))
+        assert done.wait(2)
+    finally:
+        pool.stop()
+
+    assert seen == [0, 1, 2, 3, 4]
+
+
+def test_slow_user_does_not_block_other_users():
+    """Test that a slow handler only delays events of the same user"""
+    pool = WorkerPool(num_workers=4, queue_size=16)
+    release = threading.Event()
+    fast_done = threading.Event()
+
+    def handler(body, slow=False):
+        if slow:
+            release.wait(2)
+        else:
+            fast_done.set()
+
+    pool.register("message", handler)
+    pool.start()
+    try:
+        pool.submit("message", _event("U1", slow=True))
+        pool.submit("message", _event("U2"))
+        assert fast_done.wait(1)
+    finally:
+        release.set()
+        pool.stop()
+
+
+def test_submit_blocks_when_pool_is_saturated():
+    """Test backpressure: submit() blocks once queue_size events are pending"""
+    pool = WorkerPool(num_workers=1, queue_size=1)
+    release = threading.Event()
+    pool.register("message", lambda body: release.wait(2))
+    pool.start()
+
+    submitted = threading.Event()
+
+    def producer():
+        # One event in the handler, one held by the dispatcher waiting for a slot,
+        # one in the queue; the fourth must wait
+        for _ in range(4):
+            pool.submit("message", _event("U1"))
+        submitted.set()
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    try:
+        assert not submitted.wait(0.2)
+        release.set()
+        assert submitted.wait(2)
+    finally:
+        release.set()
+        pool.stop()
+
+
+def test_handler_errors_do_not_stop_the_pool():
+    """Test that a failing handler is logged and later events still run"""
+    pool = WorkerPool(num_workers=1, queue_size=4)
+    done = threading.Event()
+
+    def handler(body, fail=False):
+        if fail:
+            raise RuntimeError("boom")
+        done.set()
+
+    pool.register("message", handler)
+    pool.start()
+    try:
+        pool.submit("message", _event("U1", fail=True))
+        pool.submit("message", _event("U1"))
+        assert done.wait(2)
+    finally:
+        pool.stop()
@@ -16,6 +16,8 @@ from .error_handling import (
     APIError,
     ConfigurationError,
     ValidationError,
+    CircuitOpenError,
+    CircuitBreaker,
     handle_exceptions,
     safe_execute,
     ErrorRegistry,
@@ -44,6 +46,8 @@ __all__ = [
     'APIError',
     'ConfigurationError',
     'ValidationError',
+    'CircuitOpenError',
+    'CircuitBreaker',
     'ErrorRegistry',
     
     # Decoradores y funciones de manejo de errores
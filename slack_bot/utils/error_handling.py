@@ -4,6 +4,8 @@ Utilidades para manejo de errores.
 import functools
 import logging
 import sys
+import threading
+import time
 import traceback
 from typing import Callable, Any, Optional, Type, Dict, List, Union
 
@@ -56,6 +58,143 @@ class ValidationError(BotError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """
+    Llamada rechazada porque el circuito del servicio está abierto.
+    """
+    pass
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker para llamadas a servicios externos.
+    
+    Tras fail_max fallos consecutivos el circuito se abre y las llamadas fallan de
+    inmediato con CircuitOpenError, en lugar de esperar el timeout del servicio
+    caído. Pasado el intervalo de apertura (reset_timeout al principio) el circuito
+    queda semiabierto y deja pasar una única llamada de prueba: si tiene éxito el
+    circuito se cierra; si falla se reabre con el intervalo duplicado, hasta
+    max_reset_timeout.
+    """
+    
+    __slots__ = (
+        'name', 'fail_max', 'reset_timeout', 'max_reset_timeout',
+        '_failures', '_opened_at', '_open_interval', '_probing', '_lock'
+    )
+    
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 30.0,
+                 max_reset_timeout: float = 300.0):
+        """
+        Inicializa el circuit breaker cerrado.
+        
+        Args:
+            name (str): Nombre del servicio protegido (para los logs).
+            fail_max (int): Fallos consecutivos que abren el circuito.
+            reset_timeout (float): Segundos que el circuito permanece abierto la primera vez.
+            max_reset_timeout (float): Máximo de segundos abierto tras pruebas fallidas sucesivas.
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._open_interval = reset_timeout
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """
+        Indica si el circuito está abierto y las llamadas se rechazan.
+        
+        Returns:
+            bool: True mientras no haya pasado el intervalo de apertura o haya una
+                llamada de prueba en curso.
+        """
+        with self._lock:
+            return self._rejects(time.monotonic())
+    
+    def _rejects(self, now: float) -> bool:
+        """
+        Indica si una llamada hecha en now debe rechazarse (con el lock tomado).
+        
+        Args:
+            now (float): Instante de la llamada, de time.monotonic().
+            
+        Returns:
+            bool: True si el circuito está abierto o su llamada de prueba está en curso.
+        """
+        opened_at = self._opened_at
+        return opened_at is not None and (self._probing or now - opened_at < self._open_interval)
+    
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Ejecuta una función a través del circuito.
+        
+        Args:
+            func (Callable): Función que llama al servicio.
+            *args: Argumentos posicionales para la función.
+            **kwargs: Argumentos de palabra clave para la función.
+            
+        Returns:
+            Any: Resultado de la función.
+            
+        Raises:
+            CircuitOpenError: Si el circuito está abierto.
+        """
+        with self._lock:
+            if self._rejects(time.monotonic()):
+                raise CircuitOpenError(f"Circuito abierto para {self.name}")
+            # Semiabierto: esta llamada es la única prueba hasta que termine
+            probe = self._opened_at is not None
+            if probe:
+                self._probing = True
+        
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record_failure(probe)
+            raise
+        except BaseException:
+            # Interrupciones: liberar la prueba sin contarla como fallo del servicio
+            if probe:
+                with self._lock:
+                    self._probing = False
+            raise
+        
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._open_interval = self.reset_timeout
+            if probe:
+                self._probing = False
+                logger.info(f"Circuito cerrado para {self.name}")
+        return result
+    
+    def _record_failure(self, probe: bool) -> None:
+        """
+        Registra un fallo y abre (o reabre) el circuito si corresponde.
+        
+        Args:
+            probe (bool): Si la llamada fallida era la prueba del circuito semiabierto.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if probe:
+                self._probing = False
+                self._open_interval = min(self._open_interval * 2, self.max_reset_timeout)
+                self._opened_at = now
+                logger.warning(f"Prueba fallida; circuito reabierto para {self.name} durante {self._open_interval:.0f}s")
+                return
+            
+            self._failures += 1
+            if self._failures >= self.fail_max and self._opened_at is None:
+                self._opened_at = now
+                self._open_interval = self.reset_timeout
+                logger.warning(f"Circuito abierto para {self.name} tras {self._failures} fallos consecutivos")
+
+
 def handle_exceptions(
     error_types: Optional[Union[Type[Exception], List[Type[Exception]]]] = None,
     default_message: str = "Se produjo un error inesperado",